@@ -1,7 +1,7 @@
 from machine import Pin
 import network
 import ujson
-import ntptime
+from wifi_manager import WiFiManager
 
 led = Pin(13, Pin.OUT)
 led.value(0)
@@ -12,14 +12,16 @@ try:
         config = ujson.load(config_file)
     wifi_ssid = config["wifi_ssid"]
     wifi_password = config["wifi_password"]
-except OSError:
+    wifi_static_ip = config.get("wifi_static_ip")  # optional [ip, subnet, gateway, dns]
+except (OSError, KeyError):
+    wifi_ssid = None
     print("Missing or incorrect WiFi configuration in config.json")
 
 wifi = network.WLAN(network.STA_IF)
 wifi.active(True)
 wifi.config(pm=wifi.PM_NONE)  # disable power management (some device get better some may get worse)
 
-try:
-    wifi.connect(wifi_ssid, wifi_password)
-except OSError:
-    pass
\ No newline at end of file
+# Start associating now, main.py keeps driving the connection with wifi_manager.run()
+if wifi_ssid is not None:
+    wifi_manager = WiFiManager(wifi, wifi_ssid, wifi_password, static_ip=wifi_static_ip)
+    wifi_manager.start()
@@ -3,11 +3,17 @@ gc.collect()
 import uasyncio as asyncio
 gc.collect()
 gc.threshold(gc.mem_free() // 4 + gc.mem_alloc()) # sets threshold to 1/4 of heap size
+import time
+from array import array
 
 
 HTTP__version__ = "1.0"
 __version__ = (0, 0, 2)
 
+# response header limits, a server sending more fails the request
+MAX_HEADERS = 32
+MAX_HEADER_BYTES = 2048
+
 
 class TimeoutError(Exception):
     pass
@@ -19,42 +25,132 @@ class ConnectionError(Exception):
 
 class Response:
 
-    def __init__(self, reader, chunked, charset, h):
+    def __init__(self, reader, chunked, charset, h, length=None, pre=None):
         self.raw = reader
         self.chunked = chunked
         self.encoder = charset
-        self.h = h
+        self.h = h # (buffer the head was read into, array of name start / colon / line end offsets)
+        self._pre = pre # memoryview of body bytes that arrived with the headers, read first
+        self._headers = None
+        self._header_cache = None
+        self.length = length # Content-Length, None reads until the server closes
+        self.remaining = length
         self.chunk_size = 0
-    
-    async def read(self, sz=-1):
-        content = b''
-        # keep reading chunked data
+        self._content = None
+        self._eof = length == 0
+        self._session = None # set when the connection may go back to a Session pool
+        self._key = None
+        self._deadline = None # ticks_ms the total timeout runs out, bounds streamed body reads
+
+    async def _available(self):
+        # body bytes that can be read without crossing a chunk or message boundary,
+        # 0 at the end of the body, -1 when the body ends with the connection
+        if self._eof:
+            return 0
         if self.chunked:
-            sz = 4*1024*1024
-            while True:
-                if self.chunk_size == 0:
-                    l = await self.raw.readline() # get Hex size
-                    l = l.split(b";", 1)[0]
-                    self.chunk_size = int(l, 16) # convert to int
-                    if self.chunk_size == 0: # end of message
-                        sep = await self.raw.read(2)
-                        assert sep == b"\r\n"
-                        break
-                data = await self.raw.read(min(sz, self.chunk_size))
-                self.chunk_size -= len(data)
-                content += data
-                if self.chunk_size == 0:
-                    sep = await self.raw.read(2)
+            if self.chunk_size == 0:
+                l = await self._raw_readline() # get Hex size
+                l = l.split(b";", 1)[0]
+                self.chunk_size = int(l, 16) # convert to int
+                if self.chunk_size == 0: # end of message
+                    sep = await self._raw_readline()
                     assert sep == b"\r\n"
-                    break
-        # non chunked data
-        else:
-            while True:
-                data = await self.raw.read(sz)
-                if not data or data == b"":
-                    break
-                content += data
-        return content
+                    self._eof = True
+                    return 0
+            return self.chunk_size
+        if self.remaining is None:
+            return -1
+        return self.remaining
+
+    async def readinto(self, buf):
+        '''
+        reads up to len(buf) bytes of the body into buf,
+        returns the number of bytes read, 0 at the end of the body;
+        on stream=True responses the total timeout of the request still applies
+        '''
+        if self._deadline is None:
+            return await self._readinto(buf)
+        try:
+            left = time.ticks_diff(self._deadline, time.ticks_ms())
+            if left <= 0:
+                raise TimeoutError("Request timed out")
+            return await _with_timeout(self._readinto(buf), left / 1000, "Request")
+        except TimeoutError:
+            self._session = None # body only partly read, the connection cannot be reused
+            self.close()
+            raise
+
+    async def _readinto(self, buf):
+        avail = await self._available()
+        if avail == 0:
+            return 0
+        mv = memoryview(buf)
+        if 0 < avail < len(mv):
+            mv = mv[:avail]
+        n = await self._raw_readinto(mv)
+        if not n:
+            self._eof = True
+            return 0
+        if self.chunked:
+            self.chunk_size -= n
+            if self.chunk_size == 0:
+                sep = await self._raw_readline()
+                assert sep == b"\r\n" # end of this chunk, continue with the next one
+        elif self.remaining is not None:
+            self.remaining -= n
+            if self.remaining == 0:
+                self._eof = True
+        return n
+
+    async def _raw_readinto(self, mv):
+        pre = self._pre
+        if pre is None:
+            return await self.raw.readinto(mv)
+        n = min(len(mv), len(pre))
+        mv[:n] = pre[:n]
+        self._pre = pre[n:] if n < len(pre) else None
+        return n
+
+    async def _raw_readline(self):
+        pre = self._pre
+        if pre is None:
+            return await self.raw.readline()
+        for i in range(len(pre)):
+            if pre[i] == 10:
+                self._pre = pre[i + 1:] if i + 1 < len(pre) else None
+                return bytes(pre[:i + 1])
+        self._pre = None
+        return bytes(pre) + await self.raw.readline()
+
+    def iter_content(self, chunk_size=512):
+        '''
+        async iterator over the body, reusing one chunk_size buffer:
+            async for chunk in resp.iter_content(256): ...
+        each chunk is a memoryview that is only valid until the next iteration
+        '''
+        return _ContentIterator(self, chunk_size)
+
+    async def read(self, sz=-1):
+        # reads the remaining body and keeps it as content
+        if self._content is not None:
+            return self._content
+        if sz <= 0:
+            sz = 512
+        parts = []
+        buf = bytearray(sz)
+        while True:
+            n = await self.readinto(buf)
+            if not n:
+                break
+            parts.append(bytes(buf[:n]))
+        self._content = b"".join(parts)
+        return self._content
+
+    @property
+    def content(self):
+        if self._content is None:
+            raise ValueError("body not read, use await read() on stream=True responses")
+        return self._content
     
     @property
     def text(self):
@@ -62,27 +158,368 @@ class Response:
     
     @property
     def headers(self):
-        result = {}
-        for i in self.h:
-             h = i.decode(self.encoder).strip().split(":", 1)
-             result[h[0]] = h[-1].strip()
-        return result
+        # decoded once on first access
+        if self._headers is None:
+            data, offsets = self.h
+            result = {}
+            for i in range(0, len(offsets), 3):
+                start, colon, end = offsets[i], offsets[i + 1], offsets[i + 2]
+                result[str(data[start:colon], self.encoder)] = str(data[colon + 1:end], self.encoder).strip()
+            self._headers = result
+        return self._headers
+
+    def header(self, name, default=None):
+        # case-insensitive lookup of a single header, without building the headers dict
+        name = name.lower()
+        if self._header_cache is None:
+            self._header_cache = {}
+        elif name in self._header_cache:
+            value = self._header_cache[name]
+            return default if value is None else value
+        data, offsets = self.h
+        key = name.encode()
+        value = None
+        for i in range(0, len(offsets), 3):
+            start, colon, end = offsets[i], offsets[i + 1], offsets[i + 2]
+            if _name_is(data, start, colon, key):
+                value = str(data[colon + 1:end], self.encoder).strip()
+                break
+        self._header_cache[name] = value
+        return default if value is None else value
 
     def json(self):
         import ujson
         return ujson.loads(self.content)
+
+    async def json_fields(self, *keys, chunk_size=256):
+        '''
+        scans a stream=True JSON object body as it arrives and returns a dict with only
+        the requested top-level keys, other values are skipped without being stored
+        '''
+        import ujson
+        wanted = set(keys)
+        result = {}
+        scanner = _JSONScanner()
+        buf = bytearray(chunk_size)
+        try:
+            while True:
+                n = await self.readinto(buf)
+                if not n:
+                    break
+                for key, value in scanner.feed(buf, n, wanted):
+                    result[key] = ujson.loads(value)
+                    wanted.discard(key)
+                if not wanted or scanner.done:
+                    break
+            # drain the rest so a keep-alive connection can be reused, otherwise just drop it
+            if self._session is not None:
+                while await self.readinto(buf):
+                    pass
+        finally:
+            self.close() # a body that was not read to the end closes the connection
+        return result
     
     def close(self):
-        pass
+        # a fully read keep-alive connection goes back to its session, anything else is closed
+        if self.raw is None:
+            return
+        if self._session is not None and self._eof:
+            self._session._release(self._key, self.raw)
+        else:
+            self.raw.s.close()
+        self.raw = None
     
     def __repr__(self):
         return "<Response [%d]>" % (self.status_code)
 
 
-async def open_connection(host, port, ssl):
+class _JSONScanner:
+    # incremental scanner over a JSON object, yields the raw bytes of wanted top-level values
+
+    def __init__(self):
+        self.depth = 0
+        self.in_str = False
+        self.esc = False
+        self.expect_key = False
+        self.in_key = False
+        self.key = bytearray()
+        self.value = None # bytearray while a wanted value is being captured
+        self.value_key = None
+        self.done = False
+
+    def feed(self, buf, n, wanted):
+        found = []
+        for i in range(n):
+            c = buf[i]
+            if self.in_str:
+                if self.value is not None:
+                    self.value.append(c)
+                if self.esc:
+                    self.esc = False
+                elif c == 0x5C: # backslash
+                    self.esc = True
+                elif c == 0x22: # closing quote
+                    self.in_str = False
+                    if self.in_key:
+                        self.in_key = False
+                        continue
+                if self.in_key:
+                    self.key.append(c)
+                continue
+            if c == 0x22: # opening quote
+                self.in_str = True
+                if self.depth == 1 and self.expect_key:
+                    self.in_key = True
+                    self.key = bytearray()
+                elif self.value is not None:
+                    self.value.append(c)
+            elif c == 0x7B or c == 0x5B: # { [
+                self.depth += 1
+                if self.depth == 1:
+                    self.expect_key = True
+                elif self.value is not None:
+                    self.value.append(c)
+            elif c == 0x7D or c == 0x5D: # } ]
+                self.depth -= 1
+                if self.depth == 0:
+                    self._finish(found)
+                    self.done = True
+                    break
+                if self.value is not None:
+                    self.value.append(c)
+            elif self.depth == 1 and c == 0x3A: # : after a top-level key
+                self.expect_key = False
+                key = self.key.decode()
+                if key in wanted:
+                    self.value_key = key
+                    self.value = bytearray()
+            elif self.depth == 1 and c == 0x2C: # , between top-level members
+                self._finish(found)
+                self.expect_key = True
+            elif self.value is not None:
+                self.value.append(c)
+        return found
+
+    def _finish(self, found):
+        if self.value is not None:
+            found.append((self.value_key, bytes(self.value)))
+            self.value = None
+
+
+class _ContentIterator:
+
+    def __init__(self, resp, chunk_size):
+        self.resp = resp
+        self.buf = bytearray(chunk_size)
+        self.mv = memoryview(self.buf)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        n = await self.resp.readinto(self.buf)
+        if not n:
+            raise StopAsyncIteration
+        return self.mv[:n]
+
+
+# DNS cache, getaddrinfo blocks the whole event loop so results are kept for DNS_TTL ms
+# and failures for DNS_NEGATIVE_TTL ms
+DNS_TTL = 300000
+DNS_NEGATIVE_TTL = 30000
+DNS_CACHE_SIZE = 8
+_dns_cache = {} # (host, port) -> (expires ticks_ms, addrinfo or OSError)
+
+
+def _resolve(host, port):
+    import usocket as socket
+    key = (host, port)
+    now = time.ticks_ms()
+    entry = _dns_cache.get(key)
+    if entry is not None and time.ticks_diff(entry[0], now) > 0:
+        if isinstance(entry[1], OSError):
+            raise entry[1]
+        return entry[1]
+    if entry is None and len(_dns_cache) >= DNS_CACHE_SIZE:
+        # drop the entry closest to expiry
+        oldest = None
+        for k in _dns_cache:
+            if oldest is None or time.ticks_diff(_dns_cache[k][0], _dns_cache[oldest][0]) < 0:
+                oldest = k
+        del _dns_cache[oldest]
+    try:
+        ai = socket.getaddrinfo(host, port)[0]
+    except OSError as er:
+        _dns_cache[key] = (time.ticks_add(now, DNS_NEGATIVE_TTL), er)
+        raise
+    _dns_cache[key] = (time.ticks_add(now, DNS_TTL), ai)
+    return ai
+
+
+def dns_flush(host=None):
+    '''
+    forget cached DNS results, for one host or all of them
+    '''
+    if host is None:
+        _dns_cache.clear()
+        return
+    for key in [k for k in _dns_cache if k[0] == host]:
+        del _dns_cache[key]
+
+
+# TLS context shared by all connections, and sessions kept for resumption on ports that expose them
+_tls_context = None
+_tls_sessions = {} # (host, port) -> ssl session
+
+
+def _wrap_tls(s, host, port):
+    '''
+    wraps a non-blocking socket without running the handshake, it is stepped by
+    _tls_handshake() or, on ports without do_handshake(), by the first stream write
+    '''
+    global _tls_context
+    try:
+        import ssl
+        if _tls_context is None:
+            _tls_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            _tls_context.verify_mode = ssl.CERT_NONE # same as the old ussl.wrap_socket default
+    except (ImportError, AttributeError):
+        # older firmware without SSLContext
+        import ussl
+        return ussl.wrap_socket(s, server_hostname=host, do_handshake=False)
+    session = _tls_sessions.get((host, port))
+    if session is not None:
+        try:
+            return _tls_context.wrap_socket(s, server_hostname=host, do_handshake_on_connect=False, session=session)
+        except TypeError:
+            _tls_sessions.clear() # port has no session resumption
+    return _tls_context.wrap_socket(s, server_hostname=host, do_handshake_on_connect=False)
+
+
+async def _tls_handshake(s):
+    from uasyncio import core
+    from uerrno import EAGAIN
+    if not hasattr(s, "do_handshake"):
+        return # handshake runs inside the first non-blocking write
+    while True:
+        try:
+            s.do_handshake()
+            return
+        except OSError as er:
+            # SSLWantReadError / SSLWantWriteError or EAGAIN, wait on the IO queue and step again
+            name = type(er).__name__
+            if name == "SSLWantWriteError":
+                await _io_wait(core._io_queue.queue_write, s)
+            elif name == "SSLWantReadError" or (er.args and er.args[0] == EAGAIN):
+                await _io_wait(core._io_queue.queue_read, s)
+            else:
+                raise
+
+
+class _IOWait:
+    # awaitable that parks the current task on the uasyncio IO queue until s is ready,
+    # a plain generator rather than a yield inside async def so CPython can load the module too
+
+    def __init__(self, queue, s):
+        self.queue = queue
+        self.s = s
+
+    def __iter__(self):
+        waiter = self.queue(self.s)
+        if waiter is None:
+            yield # uasyncio resumes the task once s is ready
+        else:
+            yield from waiter # host shim (tools/upy_shim.py) returns an asyncio future
+
+    __await__ = __iter__
+
+
+async def _io_wait(queue, s):
+    await _IOWait(queue, s)
+
+
+def _name_is(buf, start, end, name):
+    # buf[start:end] equals the lowercase name, ignoring case, compared in place
+    if end - start != len(name):
+        return False
+    for i in range(len(name)):
+        c = buf[start + i]
+        if 65 <= c <= 90: # A-Z
+            c += 32
+        if c != name[i]:
+            return False
+    return True
+
+
+async def _read_head(reader, max_headers, max_header_bytes, read_timeout):
+    '''
+    reads the status line and the headers straight into one buffer of max_header_bytes,
+    returns (buffer, end of the status line, array of name start / colon / line end offsets,
+    start of the body, bytes in the buffer) or None when the server closed the connection;
+    bytes between the start of the body and the end of the data already belong to the body
+    '''
+    buf = bytearray(max_header_bytes)
+    mv = memoryview(buf)
+    filled = await _with_timeout(reader.readinto(mv), read_timeout, "Read")
+    if not filled:
+        return None
+    offsets = array("H")
+    status_end = -1
+    start = 0 # start of the current line
+    i = 0
+    while True:
+        while i < filled and buf[i] != 10:
+            i += 1
+        if i == filled:
+            if filled == len(buf):
+                raise ValueError("Response headers exceed max_headers or max_header_bytes")
+            n = await reader.readinto(mv[filled:])
+            if not n:
+                if status_end < 0:
+                    raise ValueError("Connection closed in the status line")
+                return buf, status_end, offsets, filled, filled
+            filled += n
+            continue
+        end = i - 1 if i > start and buf[i - 1] == 13 else i # strip CRLF
+        i += 1
+        if status_end < 0:
+            status_end = end
+        elif end == start:
+            return buf, status_end, offsets, i, filled # empty line, the body follows
+        else:
+            colon = start
+            while colon < end and buf[colon] != 58: # ":"
+                colon += 1
+            if colon < end:
+                if len(offsets) >= max_headers * 3:
+                    raise ValueError("Response headers exceed max_headers or max_header_bytes")
+                offsets.append(start)
+                offsets.append(colon)
+                offsets.append(end)
+        start = i
+
+
+def _save_tls_session(reader, key):
+    session = getattr(reader.s, "session", None)
+    if session is not None:
+        _tls_sessions[key[:2]] = session
+
+
+async def _with_timeout(coro, timeout, phase):
+    # runs one phase of a request under its own deadline, enforced by the event loop
+    if timeout is None:
+        return await coro
+    try:
+        return await asyncio.wait_for(coro, timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError("%s timed out" % phase)
+
+
+async def open_connection(host, port, ssl, connect_timeout=None, tls_timeout=None):
     '''
     replaces asyncio.open_connect in order to add ssl support
-    SSL will block
+    the TLS handshake is non-blocking, it is stepped through the uasyncio IO queue
+    DNS lookups cannot be interrupted, connect_timeout starts once the address is known
     '''
     from uasyncio import core
     gc.collect()
@@ -93,24 +530,80 @@ async def open_connection(host, port, ssl):
     import usocket as socket
     gc.collect()
 
-    ai = socket.getaddrinfo(host, port)[0]
+    ai = _resolve(host, port)
     s = socket.socket(ai[0], ai[1], ai[2])
-    s.setblocking(False)
     try:
-        s.connect(ai[-1])
-    except OSError as er:
-        if er.args[0] != EINPROGRESS:
-            raise er
-    yield core._io_queue.queue_write(s)
-    if ssl:
-        import ussl
-        s = ussl.wrap_socket(s, server_hostname=host) # WARNING, this blocks for a long time
-    yield core._io_queue.queue_write(s)
+        s.setblocking(False)
+        try:
+            s.connect(ai[-1])
+        except OSError as er:
+            if er.args[0] != EINPROGRESS:
+                _dns_cache.pop((host, port), None) # the address may have changed, resolve again next time
+                raise er
+        await _with_timeout(_io_wait(core._io_queue.queue_write, s), connect_timeout, "Connect")
+        if ssl:
+            s = _wrap_tls(s, host, port)
+            await _with_timeout(_tls_handshake(s), tls_timeout, "TLS handshake")
+        await _io_wait(core._io_queue.queue_write, s)
+    except BaseException:
+        # includes cancellation by an outer timeout, never leak the socket
+        s.close()
+        raise
     ss = Stream(s)
     return ss, ss
 
 
-async def _request_raw(method, url, headers, data, json):
+class Session:
+    '''
+    opt-in HTTP/1.1 keep-alive, idle connections are pooled per (host, port, ssl)
+    and reused by requests made through the session
+    '''
+
+    def __init__(self, idle_timeout=30000, max_idle=2):
+        self.idle_timeout = idle_timeout # ms an idle connection is kept
+        self.max_idle = max_idle # idle connections kept per host
+        self._pool = {}
+
+    def _take(self, key):
+        conns = self._pool.get(key)
+        now = time.ticks_ms()
+        while conns:
+            reader, last_used = conns.pop()
+            if time.ticks_diff(now, last_used) < self.idle_timeout:
+                return reader
+            reader.s.close()
+        return None
+
+    def _release(self, key, reader):
+        conns = self._pool.setdefault(key, [])
+        if len(conns) >= self.max_idle:
+            reader.s.close()
+        else:
+            conns.append((reader, time.ticks_ms()))
+
+    def close(self):
+        for conns in self._pool.values():
+            for reader, last_used in conns:
+                reader.s.close()
+        self._pool = {}
+
+    async def get(self, url, **kwargs):
+        return await get(url, session=self, **kwargs)
+
+    async def head(self, url, **kwargs):
+        return await head(url, session=self, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await post(url, session=self, **kwargs)
+
+    async def put(self, url, **kwargs):
+        return await put(url, session=self, **kwargs)
+
+    async def delete(self, url, **kwargs):
+        return await delete(url, session=self, **kwargs)
+
+
+def _parse_url(url):
     try:
         proto, dummy, host, path = url.split("/", 3)
     except ValueError:
@@ -118,6 +611,7 @@ async def _request_raw(method, url, headers, data, json):
         path = ""
     try:
         host, port = host.split(":")
+        port = int(port)
         if proto == "https:":
             ssl = True
         elif proto == "http:":
@@ -133,9 +627,16 @@ async def _request_raw(method, url, headers, data, json):
             ssl = True
         else:
             raise ValueError("Unsupported protocol: %s" % (proto))
-    # using new open_connection rather than uasyncio.open_connection to add ssl support
-    reader, writer = await open_connection(host, port, ssl)
-    query = "%s /%s HTTP/%s\r\nHost: %s\r\nConnection: close\r\n%s" % (method, path, HTTP__version__, host, headers)
+    return host, port, ssl, path
+
+
+async def _request_raw(method, url, headers, data, json, session=None, reuse=True, \
+                       connect_timeout=None, tls_timeout=None):
+    host, port, ssl, path = _parse_url(url)
+    if session is not None:
+        query = "%s /%s HTTP/1.1\r\nHost: %s\r\nConnection: keep-alive\r\n%s" % (method, path, host, headers)
+    else:
+        query = "%s /%s HTTP/%s\r\nHost: %s\r\nConnection: close\r\n%s" % (method, path, HTTP__version__, host, headers)
     if "User-Agent:" not in query:
         query += "User-Agent: compat\r\n"
     if json is not None:
@@ -150,13 +651,44 @@ async def _request_raw(method, url, headers, data, json):
     query += "\r\n"
     if data:
         query += data
-    await writer.awrite(query.encode())
-    return reader
+    query = query.encode()
+    key = (host, port, ssl)
+    while True:
+        reader = None
+        if session is not None and reuse:
+            reader = session._take(key)
+        reused = reader is not None
+        if reader is None:
+            # using new open_connection rather than uasyncio.open_connection to add ssl support
+            reader, writer = await open_connection(host, port, ssl, connect_timeout, tls_timeout)
+        try:
+            if ssl and not reused:
+                # on ports without do_handshake() the TLS handshake runs inside this first write
+                await _with_timeout(reader.awrite(query), tls_timeout, "TLS handshake")
+            else:
+                await reader.awrite(query)
+            return reader, key, reused
+        except OSError:
+            reader.s.close()
+            if not reused:
+                raise
+            # pooled connection was closed by the server, retry on a fresh one
+            reuse = False
+        except BaseException:
+            reader.s.close()
+            raise
 
 
 async def _requests(method, url, params={}, data=None, headers={}, cookies=None, \
                     files=None, auth=None, timeout=None, allow_redirects=True, \
-                    proxies=None, hooks=None, stream=None, verify=None, cert=None, json=None):
+                    proxies=None, hooks=None, stream=None, verify=None, cert=None, json=None, session=None, \
+                    max_headers=MAX_HEADERS, max_header_bytes=MAX_HEADER_BYTES, \
+                    connect_timeout=None, tls_timeout=None, read_timeout=None, deadline=None):
+    '''
+    connect_timeout, tls_timeout and read_timeout (time to the first response byte) bound
+    the phases of a request in seconds, the whole request is bounded by get(timeout=...),
+    which also passes its end as deadline for the body reads of a stream=True response
+    '''
     try:
         #headers support
         h = ""
@@ -177,95 +709,140 @@ async def _requests(method, url, params={}, data=None, headers={}, cookies=None,
             url = url[0:len(url)-1]
     except Exception as e:
         raise e
+    keep_alive = False
+    reader = None
     try:
         # build in redirect support
         redir_cnt = 0
         redir_url = None
         while redir_cnt < 2:
-            reader = await _request_raw(method=method, url=url, headers=h, data=data, json=json)
-            sline = await reader.readline()
-            sline = sline.split(None, 2)
+            reader, key, reused = await _request_raw(method=method, url=url, headers=h, data=data, json=json, session=session, \
+                                                     connect_timeout=connect_timeout, tls_timeout=tls_timeout)
+            head = await _read_head(reader, max_headers, max_header_bytes, read_timeout)
+            if head is None and reused:
+                # pooled connection was closed by the server, retry on a fresh one
+                await reader.wait_closed()
+                reader = None
+                reader, key, reused = await _request_raw(method=method, url=url, headers=h, data=data, json=json, session=session, reuse=False, \
+                                                         connect_timeout=connect_timeout, tls_timeout=tls_timeout)
+                head = await _read_head(reader, max_headers, max_header_bytes, read_timeout)
+            if head is None:
+                raise ValueError("Connection closed before the response")
+            if key[2]:
+                _save_tls_session(reader, key)
+            hbuf, status_end, offsets, body_start, filled = head
+            sline = bytes(hbuf[:status_end]).split(None, 2)
             status_code = int(sline[1])
             if len(sline) > 1:
                 reason = sline[2].decode().rstrip()
             chunked = False
             json = None
-            headers = []
             charset = 'utf-8'
-            # read headers
-            while True:
-                line = await reader.readline()
-                if not line or line == b"\r\n":
-                    break
-                headers.append(line)
-                if line.startswith(b"Transfer-Encoding:"):
-                    if b"chunked" in line:
+            length = None
+            # HTTP/1.1 keeps the connection open unless the server says otherwise
+            keep_alive = session is not None and sline[0] == b"HTTP/1.1"
+            # header names are matched in the buffer, only the values that matter are copied out
+            for i in range(0, len(offsets), 3):
+                start, colon, end = offsets[i], offsets[i + 1], offsets[i + 2]
+                if _name_is(hbuf, start, colon, b"transfer-encoding"):
+                    if b"chunked" in bytes(hbuf[colon + 1:end]):
                         chunked = True
-                elif line.startswith(b"Location:"):
-                    url = line.rstrip().split(None, 1)[1].decode()
-                elif line.startswith(b"Content-Type:"):
-                    if b"application/json" in line:
+                elif _name_is(hbuf, start, colon, b"location"):
+                    url = bytes(hbuf[colon + 1:end]).strip().decode()
+                elif _name_is(hbuf, start, colon, b"content-length"):
+                    length = int(bytes(hbuf[colon + 1:end]))
+                elif _name_is(hbuf, start, colon, b"connection"):
+                    if b"close" in bytes(hbuf[colon + 1:end]).lower():
+                        keep_alive = False
+                elif _name_is(hbuf, start, colon, b"content-type"):
+                    value = bytes(hbuf[colon + 1:end])
+                    if b"application/json" in value:
                         json = True
-                    if b"charset" in line:
+                    if b"charset" in value:
                         # get decoder
-                        charset = line.rstrip().decode().split(None, 2)[-1].split("=")[-1]
+                        charset = value.decode().split("charset=")[-1].split(";")[0].strip()
+            headers = (hbuf, offsets)
             #look for redirects
             if allow_redirects is False:
                 break
             if 301 <= status_code <= 303:
                 redir_cnt += 1
+                keep_alive = False
                 await reader.wait_closed()
+                reader = None
                 continue
             break
-        
-        resp = Response(reader, chunked, charset, headers)
-        resp.content = await resp.read()
+
+        if method == "HEAD" or status_code in (204, 304) or status_code < 200:
+            length = 0 # no body follows
+        elif not chunked and length is None:
+            keep_alive = False # body ends when the server closes the connection
+
+        pre = memoryview(hbuf)[body_start:filled] if body_start < filled else None
+        resp = Response(reader, chunked, charset, headers, length, pre)
         resp.status_code = status_code
         resp.reason = reason
         resp.url = url
+        if keep_alive:
+            resp._session = session
+            resp._key = key
+        if not stream:
+            await resp.read()
+            resp.close()
+        else:
+            resp._deadline = deadline
+        # with stream=True the caller reads the body and closes the response
+        reader = None
         return resp
     
+    except TimeoutError:
+        raise
     except Exception as e:
         raise ConnectionError(e)
     finally:
-        try:
-            await reader.wait_closed()
-        except NameError:
-            pass
+        # also runs when an outer timeout cancels the request
+        if reader is not None:
+            reader.s.close()
         gc.collect()
 
 
+def _deadline(timeout):
+    if timeout is None:
+        return None
+    return time.ticks_add(time.ticks_ms(), int(timeout * 1000))
+
+
 async def get(url, timeout=10, **kwargs):
     try:
-        return await asyncio.wait_for(_requests("GET", url, **kwargs), timeout=timeout)
+        return await asyncio.wait_for(_requests("GET", url, deadline=_deadline(timeout), **kwargs), timeout=timeout)
     except asyncio.TimeoutError as e:
         raise TimeoutError(e)
     
 
 async def head(url, timeout=10, **kwargs):
     try:
-        return await asyncio.wait_for(_requests("HEAD", url, **kwargs), timeout=timeout)
+        return await asyncio.wait_for(_requests("HEAD", url, deadline=_deadline(timeout), **kwargs), timeout=timeout)
     except asyncio.TimeoutError as e:
         raise TimeoutError(e)
 
 
 async def post(url, timeout=10, **kwargs):
     try:
-        return await asyncio.wait_for(_requests("POST", url, **kwargs), timeout=timeout)
+        return await asyncio.wait_for(_requests("POST", url, deadline=_deadline(timeout), **kwargs), timeout=timeout)
     except asyncio.TimeoutError as e:
         raise TimeoutError(e)
 
 
 async def put(url, timeout=10, **kwargs):
     try:
-        return await asyncio.wait_for(_requests("PUT", url, **kwargs), timeout=timeout)
+        return await asyncio.wait_for(_requests("PUT", url, deadline=_deadline(timeout), **kwargs), timeout=timeout)
     except asyncio.TimeoutError as e:
         raise TimeoutError(e)
 
 
 async def delete(url, timeout=10, **kwargs):
     try:
-        return await asyncio.wait_for(_requests("DELETE", url, **kwargs), timeout=timeout)
+        return await asyncio.wait_for(_requests("DELETE", url, deadline=_deadline(timeout), **kwargs), timeout=timeout)
     except asyncio.TimeoutError as e:
         raise TimeoutError(e)
 
@@ -0,0 +1,95 @@
+# Bitmap font read from flash, glyph by glyph
+#
+# font.bin is rendered from lib/vector_font.py by tools/build_font.py. Layout, little endian:
+#   header   "<4sBBB"  magic, version, glyph count G, size count S
+#   chars    G bytes   character codes, uppercase letters also serve lowercase
+#   sizes    S x "<BBBI"  font_size, height, advance, offset of the glyph table
+#   glyphs   G x "<IB" per size  offset of the bitmap (0 = blank glyph), width
+#   bitmaps  MONO_VLSB, width * ((height + 7) // 8) bytes each
+# Only the header and size table stay in RAM, glyphs are read on first use and kept in
+# a small LRU so the digits of the clock face are a blit from memory.
+
+import framebuf
+import struct
+
+MAGIC = b"SFNT"
+VERSION = 1
+HEADER_FORMAT = "<4sBBB"
+SIZE_FORMAT = "<BBBI"
+GLYPH_FORMAT = "<IB"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+SIZE_SIZE = struct.calcsize(SIZE_FORMAT)
+GLYPH_SIZE = struct.calcsize(GLYPH_FORMAT)
+
+
+class BitmapFont:
+    def __init__(self, path="font.bin", cache_size=12):
+        self.f = open(path, "rb")
+        magic, version, count, sizes = struct.unpack(HEADER_FORMAT, self.f.read(HEADER_SIZE))
+        if magic != MAGIC or version != VERSION:
+            self.f.close()
+            raise OSError("bad font file")
+        self.index = {}
+        for i, code in enumerate(self.f.read(count)):
+            char = chr(code)
+            self.index[char] = i
+            self.index[char.lower()] = i
+        self.sizes = {}  # font_size -> (height, advance, glyph table offset)
+        for _ in range(sizes):
+            font_size, height, advance, table = struct.unpack(SIZE_FORMAT, self.f.read(SIZE_SIZE))
+            self.sizes[font_size] = (height, advance, table)
+        self.cache_size = cache_size
+        self.cache = {}  # (font_size, glyph index) -> FrameBuffer, None for blank glyphs
+        self.order = []  # cache keys, least recently used first
+        self.glyph_buf = bytearray(GLYPH_SIZE)
+        self.palette = None
+
+    def has_size(self, font_size):
+        return font_size in self.sizes
+
+    def glyph(self, font_size, i):
+        key = (font_size, i)
+        order = self.order
+        if key in self.cache:
+            if order[-1] != key:
+                order.remove(key)
+                order.append(key)
+            return self.cache[key]
+        height, advance, table = self.sizes[font_size]
+        self.f.seek(table + i * GLYPH_SIZE)
+        self.f.readinto(self.glyph_buf)
+        offset, width = struct.unpack(GLYPH_FORMAT, self.glyph_buf)
+        fb = None
+        if offset:
+            buf = bytearray(width * ((height + 7) // 8))
+            self.f.seek(offset)
+            self.f.readinto(buf)
+            fb = framebuf.FrameBuffer(buf, width, height, framebuf.MONO_VLSB)
+        if len(order) >= self.cache_size:
+            del self.cache[order.pop(0)]
+        self.cache[key] = fb
+        order.append(key)
+        return fb
+
+    def draw(self, fbuf, text, x, y, font_size, fill=1):
+        advance = self.sizes[font_size][1]
+        if fill:
+            key, palette = 0, None
+        else:
+            # draw set glyph pixels as 0 and leave the background alone
+            if self.palette is None:
+                self.palette = framebuf.FrameBuffer(bytearray((0x80,)), 2, 1, framebuf.MONO_HLSB)
+            key, palette = 1, self.palette
+        for char in text:
+            i = self.index.get(char)
+            if i is not None:
+                fb = self.glyph(font_size, i)
+                if fb is not None:
+                    if palette is None:
+                        fbuf.blit(fb, x, y, key)
+                    else:
+                        fbuf.blit(fb, x, y, key, palette)
+            x += advance
+
+    def close(self):
+        self.f.close()
@@ -0,0 +1,49 @@
+# Watercolor rainbow cycle effect (Experimental, mostly working but not smooth enough like iCUE's)
+# Loaded by effects.get() the first time a segment switches to it
+
+from effects import Effect, register, interpolate_color, repeat_colors, scale_brightness
+
+# Define a list of the Watercolors (CMYK)
+COLORS = [
+    (255, 255, 255),
+    (0, 255, 255),
+    (255, 255, 255),
+    (255, 0, 255),
+    (255, 255, 255),
+    (255, 255, 0),
+]
+
+
+def watercolor_table(seg, params):
+    # every watercolor repeated over "spread" pixels
+    return repeat_colors(COLORS, params["spread"])
+
+
+def watercolor_rainbow_cycle(seg, params):
+    colors = seg.tables
+    num_colors = len(colors)
+    wait = params["wait"] * 10
+    np = seg.np
+    start = seg.start
+    count = seg.count
+
+    for j in range(-count * 2, count * 2):
+        for i in range(count):
+            color_index = (i + j) % (num_colors * 2)
+
+            if color_index >= num_colors:
+                color_index = (num_colors - 1) - (color_index - num_colors)
+
+            # Calculate a smooth transition between colors
+            ratio = abs(j) / (count * 2)
+
+            # Interpolate between consecutive colors
+            interpolated_color = interpolate_color(colors[color_index], colors[(color_index + 1) % num_colors], ratio)
+
+            # Scale the brightness of the interpolated color
+            np[start + i] = scale_brightness(interpolated_color, seg.current_brightness)
+
+        yield wait
+
+
+register(Effect("watercolor", "Watercolor", watercolor_rainbow_cycle, {"wait": (5, 100), "spread": (6, 50)}, watercolor_table))
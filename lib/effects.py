@@ -0,0 +1,183 @@
+# NeoPixel effect registry
+#
+# Every effect is an Effect with a name (the Home Assistant effect), the label shown on the
+# display, its parameters with their defaults, and a render generator. render(seg, params)
+# draws one frame of the segment into seg.np per step and yields the ms until its next frame;
+# when it returns, the segment starts it again. Parameters are positive integers up to the
+# maximum the effect declares next to each default, set per segment over MQTT. An optional prepare(seg, params) builds lookup tables the renderer finds
+# in seg.tables; they are only rebuilt when the segment or its parameters change.
+#
+# Effects living in other modules are registered by module name with register_lazy() and only
+# imported the first time a segment switches to them. Such a module calls register() for its
+# effects at import time.
+
+import math
+import urandom
+
+FRAME_MS = 20  # frame time of effects that only move during a transition
+FRAME_IDLE_MS = 50  # longest the renderer sleeps, bounds how long an MQTT change waits to be drawn
+
+# Label area on the display, 10 characters of the 8x8 font
+LABEL_LEFT = 24
+LABEL_WIDTH = 80
+
+
+class Effect:
+    def __init__(self, name, label, render, params=None, prepare=None):
+        self.name = name
+        self.label = label  # at most 10 characters
+        self.render = render
+        self.params = {}  # parameter name -> default
+        self.limits = {}  # parameter name -> largest accepted value, bounds table sizes and waits
+        for key, (default, limit) in (params or {}).items():
+            self.params[key] = default
+            self.limits[key] = limit
+        self.prepare = prepare
+
+    def accepts(self, key, value):
+        # positive integers only, a zero step count or delay would stall the renderer
+        return key in self.limits and isinstance(value, int) and 1 <= value <= self.limits[key]
+
+
+registry = {}  # effect name -> Effect, or the module name of a lazily loaded effect
+
+
+def register(effect):
+    registry[effect.name] = effect
+
+
+def register_lazy(name, module):
+    if not isinstance(registry.get(name), Effect):
+        registry[name] = module
+
+
+def get(name):
+    # Effect for name, or None for unknown effects
+    effect = registry.get(name)
+    if isinstance(effect, str):
+        try:
+            __import__(effect)
+        except ImportError:
+            print("Unable to load effect module", effect)
+        effect = registry.get(name)
+        if not isinstance(effect, Effect):
+            registry.pop(name, None)  # do not try the import again
+            return None
+    return effect
+
+
+# Helper Functions
+def wheel(pos):
+    # Input a value 0 to 255 to get a color value.
+    # The colors are a transition from red to green to blue and back to red.
+    if pos < 85:
+        return (int(pos * 3), int(255 - pos * 3), 0)
+    elif pos < 170:
+        pos -= 85
+        return (int(255 - pos * 3), 0, int(pos * 3))
+    else:
+        pos -= 170
+        return (0, int(pos * 3), int(255 - pos * 3))
+
+
+def scale_brightness(color, brightness):
+    return (
+        int(color[0] * brightness),
+        int(color[1] * brightness),
+        int(color[2] * brightness)
+    )
+
+
+def interpolate_color(color1, color2, ratio):
+    # Interpolate between two colors based on the given ratio
+    return (
+        int(color1[0] + ratio * (color2[0] - color1[0])),
+        int(color1[1] + ratio * (color2[1] - color1[1])),
+        int(color1[2] + ratio * (color2[2] - color1[2]))
+    )
+
+
+def repeat_colors(colors, factor):
+    repeated_colors = []
+
+    for color in colors:
+        for _ in range(factor):
+            repeated_colors.append(color)
+
+    return repeated_colors
+
+
+def random_color():
+    return (urandom.randint(0, 255), urandom.randint(0, 255), urandom.randint(0, 255))
+
+
+# Color Effects
+
+def static_color(seg, params):
+    while True:
+        seg.fill(scale_brightness(seg.current_rgb, seg.current_brightness))
+        # only changes while a transition runs, MQTT changes wake the segment up anyway
+        yield FRAME_MS if seg.transition_from is not None else FRAME_IDLE_MS
+
+
+def breathing_table(seg, params):
+    # one brightness level per step of the sine wave
+    steps = params["steps"]
+    return [0.5 * (1 + math.sin(2 * math.pi * step / steps)) for step in range(steps)]
+
+
+def color_breathing(seg, params):
+    delay = max(1, params["duration"] // params["steps"])
+    for level in seg.tables:
+        seg.fill(scale_brightness(seg.current_rgb, seg.current_brightness * level))
+        yield delay
+
+
+def color_flash(seg, params):
+    for _ in range(params["flashes"]):
+        seg.fill(scale_brightness(seg.current_rgb, seg.current_brightness))
+        yield params["flash_duration"]
+        seg.fill((0, 0, 0))  # Turn off the lights
+        yield params["delay"]
+
+
+def random_flash(seg, params):
+    for _ in range(params["flashes"]):
+        seg.fill(scale_brightness(random_color(), seg.current_brightness))
+        yield params["flash_duration"]
+        seg.fill((0, 0, 0))  # Turn off the lights
+        yield params["delay"]
+
+
+def rainbow_table(seg, params):
+    # wheel offset of every pixel, the rainbow spans the segment
+    return bytes(i * 256 // seg.count for i in range(seg.count))
+
+
+def rainbow_cycle(seg, params):
+    np = seg.np
+    start = seg.start
+    offsets = seg.tables
+    wait = params["wait"]
+    for j in range(255):
+        for i in range(len(offsets)):
+            np[start + i] = scale_brightness(wheel((offsets[i] + j) & 255), seg.current_brightness)
+        yield wait
+
+
+def idle(seg, params):
+    # Unknown Values, leave the pixels as they are
+    while True:
+        yield FRAME_IDLE_MS
+
+
+register(Effect("static", "Static", static_color))
+# parameters as name -> (default, maximum)
+register(Effect("breathing", "Breathing", color_breathing, {"duration": (2000, 60000), "steps": (100, 500)}, breathing_table))
+register(Effect("flashing", "Flashing", color_flash, {"flashes": (5, 100), "flash_duration": (50, 10000), "delay": (500, 60000)}))
+register(Effect("random_flash", "R.Flashing", random_flash, {"flashes": (5, 100), "flash_duration": (50, 10000), "delay": (500, 60000)}))
+register(Effect("rainbow", "Rainbow", rainbow_cycle, {"wait": (10, 1000)}, rainbow_table))
+register_lazy("watercolor", "effect_watercolor")
+# Random effect (randomly loop among all color effects), Coming Soon
+
+UNKNOWN = Effect("unknown", "UnknownVal", idle)
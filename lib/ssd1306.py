@@ -33,10 +33,26 @@ class SSD1306(framebuf.FrameBuffer):
         self.pages = self.height // 8
         self.buffer = bytearray(self.pages * self.width)
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
+        x0 = 0
+        x1 = self.width - 1
+        if self.width == 64:
+            # displays with width of 64 pixels are shifted by 32
+            x0 += 32
+            x1 += 32
+        # address window sent before every frame, built once
+        self.show_cmds = bytes((SET_COL_ADDR, x0, x1, SET_PAGE_ADDR, 0, self.pages - 1))
+        self.back_pages = None  # per-page views of the back buffer, allocated by the first show_async()
+        self.flushing = False
+        self.font = None  # BitmapFont set by load_font(), wrap() falls back to vector_font without one
         self.init_display()
 
+    def write_cmds(self, cmds):
+        # send a sequence of command bytes, transports override this with a single transfer
+        for cmd in cmds:
+            self.write_cmd(cmd)
+
     def init_display(self):
-        for cmd in (
+        self.write_cmds(bytes((
             SET_DISP | 0x00,  # off
             # address setting
             SET_MEM_ADDR,
@@ -66,9 +82,8 @@ class SSD1306(framebuf.FrameBuffer):
             # charge pump
             SET_CHARGE_PUMP,
             0x10 if self.external_vcc else 0x14,
-            SET_DISP | 0x01,
-        ):  # on
-            self.write_cmd(cmd)
+            SET_DISP | 0x01,  # on
+        )))
         self.fill(0)
         self.show()
 
@@ -79,88 +94,52 @@ class SSD1306(framebuf.FrameBuffer):
         self.write_cmd(SET_DISP | 0x01)
 
     def contrast(self, contrast):
-        self.write_cmd(SET_CONTRAST)
-        self.write_cmd(contrast)
+        self.write_cmds(bytes((SET_CONTRAST, contrast)))
 
     def invert(self, invert):
         self.write_cmd(SET_NORM_INV | (invert & 1))
 
     def show(self):
-        x0 = 0
-        x1 = self.width - 1
-        if self.width == 64:
-            # displays with width of 64 pixels are shifted by 32
-            x0 += 32
-            x1 += 32
-        self.write_cmd(SET_COL_ADDR)
-        self.write_cmd(x0)
-        self.write_cmd(x1)
-        self.write_cmd(SET_PAGE_ADDR)
-        self.write_cmd(0)
-        self.write_cmd(self.pages - 1)
+        self.write_cmds(self.show_cmds)
         self.write_data(self.buffer)
 
+    async def show_async(self):
+        # Double buffered flush: the frame is copied to a back buffer and sent one page at a time,
+        # yielding to other tasks between pages while drawing into self.buffer can go on
+        import uasyncio as asyncio
+
+        while self.flushing:
+            await asyncio.sleep_ms(0)
+        if self.back_pages is None:
+            back = memoryview(bytearray(len(self.buffer)))
+            self.back_pages = [back[page * self.width:(page + 1) * self.width] for page in range(self.pages)]
+            self.back = back
+        self.flushing = True
+        try:
+            self.back[:] = self.buffer
+            # the controller keeps its RAM pointer between transfers, so the pages continue the same window
+            self.write_cmds(self.show_cmds)
+            for page in self.back_pages:
+                self.write_data(page)
+                await asyncio.sleep_ms(0)
+        finally:
+            self.flushing = False
+
     def clear(self):
         self.fill(0)
 
+    def load_font(self, path="font.bin", cache_size=12):
+        # bitmap glyphs from tools/build_font.py, raises OSError when the file is missing
+        from bitmap_font import BitmapFont
+        self.font = BitmapFont(path, cache_size)
+
     def wrap(self, text, x, y, font_size=2, fill=1):
         # display.wrap("Hello World",2,8,2,1)
-
-        char_function_map = {
-            'A': A, 'a': A,
-            'B': B, 'b': B,
-            'C': C, 'c': C,
-            'D': D, 'd': D,
-            'E': E, 'e': E,
-            'F': F, 'f': F,
-            'G': G, 'g': G,
-            'H': H, 'h': H,
-            'I': I, 'i': I,
-            'J': J, 'j': J,
-            'K': K, 'k': K,
-            'L': L, 'l': L,
-            'M': M, 'm': M,
-            'N': N, 'n': N,
-            'O': O, 'o': O,
-            'P': P, 'p': P,
-            'Q': Q, 'q': Q,
-            'R': R, 'r': R,
-            'S': S, 's': S,
-            'T': T, 't': T,
-            'U': U, 'u': U,
-            'V': V, 'v': V,
-            'W': W, 'w': W,
-            'X': X, 'x': X,
-            'Y': Y, 'y': Y,
-            'Z': Z, 'z': Z,
-            '0': zero,
-            '1': one,
-            '2': two,
-            '3': three,
-            '4': four,
-            '5': five,
-            '6': six,
-            '7': seven,
-            '8': eight,
-            '9': nine,
-            '.': period,
-            '!': exclam,
-            '?': question,
-            '/': slash,
-            ':': colon,
-            ',': comma,
-            '&': amp,
-            '+': plus,
-            '-': minus,
-            '=': equal,
-        }
-
-        # Loop through each character in the text and call the corresponding function
-        for i in range(len(text)):
-            char = text[i]
-            if char in char_function_map:
-                char_function_map[char](x, y, self, font_size, fill)
-            x = x + (font_size * 5)
+        if self.font is not None and self.font.has_size(font_size):
+            self.font.draw(self, text, x, y, font_size, fill)
+            return
+        import vector_font
+        vector_font.wrap(self, text, x, y, font_size, fill)
 
     def bold_wrap(self, text, x, y, font_size=2, fill=1):
         for i in range(font_size):
@@ -185,6 +164,7 @@ class SSD1306_I2C(SSD1306):
         self.addr = addr
         self.temp = bytearray(2)
         self.write_list = [b"\x40", None]  # Co=0, D/C#=1
+        self.cmd_list = [b"\x00", None]  # Co=0, D/C#=0, every following byte is a command
         super().__init__(width, height, external_vcc)
 
     def write_cmd(self, cmd):
@@ -192,6 +172,11 @@ class SSD1306_I2C(SSD1306):
         self.temp[1] = cmd
         self.i2c.writeto(self.addr, self.temp)
 
+    def write_cmds(self, cmds):
+        # one I2C transaction for the whole sequence
+        self.cmd_list[1] = cmds
+        self.i2c.writevto(self.addr, self.cmd_list)
+
     def write_data(self, buf):
         self.write_list[1] = buf
         self.i2c.writevto(self.addr, self.write_list)
@@ -207,6 +192,7 @@ class SSD1306_SPI(SSD1306):
         self.dc = dc
         self.res = res
         self.cs = cs
+        self.cmd_buf = bytearray(1)
         import time
 
         self.res(1)
@@ -217,11 +203,16 @@ class SSD1306_SPI(SSD1306):
         super().__init__(width, height, external_vcc)
 
     def write_cmd(self, cmd):
+        self.cmd_buf[0] = cmd
+        self.write_cmds(self.cmd_buf)
+
+    def write_cmds(self, cmds):
+        # one SPI burst for the whole sequence
         self.spi.init(baudrate=self.rate, polarity=0, phase=0)
         self.cs(1)
         self.dc(0)
         self.cs(0)
-        self.spi.write(bytearray([cmd]))
+        self.spi.write(cmds)
         self.cs(1)
 
     def write_data(self, buf):
@@ -231,548 +222,3 @@ class SSD1306_SPI(SSD1306):
         self.cs(0)
         self.spi.write(buf)
         self.cs(1)
-
-# The Alphabets
-
-def A(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 5),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 5),int(y + font_size * 1),int(x + font_size * 10),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 3),int(y + font_size * 11),int(x + font_size * 8),int(y + font_size * 11),fill)
-
-    
-    
-def B(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 6),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 6),int(y + font_size * 1),int(x + font_size * 8),int(y + font_size * 3),fill)
-    oled.line(int(x + font_size * 8),int(y + font_size * 3),int(x + font_size * 8),int(y + font_size * 4),fill)
-    oled.line(int(x + font_size * 8),int(y + font_size * 4),int(x + font_size * 6),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 5),int(y + font_size * 7),int(x + font_size * 1),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 6),int(y + font_size * 7),int(x + font_size * 9),int(y + font_size * 10),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 10),int(x + font_size * 9),int(y + font_size * 12),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 12),int(x + font_size * 6),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 6),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 15),fill)
-        
-    
-def C(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 10),int(y + font_size * 2),int(x + font_size * 9),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 1),int(x + font_size * 4),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 4),int(y + font_size * 1),int(x + font_size * 2),int(y + font_size * 3),fill)
-    oled.line(int(x + font_size * 2),int(y + font_size * 3),int(x + font_size * 1),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 1),int(y + font_size * 12),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 12),int(x + font_size * 4),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 4),int(y + font_size * 15),int(x + font_size * 8),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 8),int(y + font_size * 15),int(x + font_size * 10),int(y + font_size * 13),fill)
-    
-    
-def D(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 6),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 6),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 3),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 3),int(x + font_size * 9),int(y + font_size * 12),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 12),int(x + font_size * 6),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 6),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 15),fill)
-    
-    
-def E(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 7),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 15),fill)
-    
-    
-def F(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 6),int(y + font_size * 7),fill)
-    
-    
-def G(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 9),int(y + font_size * 2),int(x + font_size * 8),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 8),int(y + font_size * 1),int(x + font_size * 4),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 4),int(y + font_size * 1),int(x + font_size * 2),int(y + font_size * 3),fill)
-    oled.line(int(x + font_size * 2),int(y + font_size * 3),int(x + font_size * 1),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 1),int(y + font_size * 12),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 12),int(x + font_size * 4),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 4),int(y + font_size * 15),int(x + font_size * 8),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 8),int(y + font_size * 15),int(x + font_size * 10),int(y + font_size * 13),fill)
-    oled.line(int(x + font_size * 10),int(y + font_size * 13),int(x + font_size * 10),int(y + font_size * 9),fill)
-    oled.line(int(x + font_size * 10),int(y + font_size * 9),int(x + font_size * 6),int(y + font_size * 9),fill)    
-    
-
-def H(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 9),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 1),fill)
-    
-
-def I(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 5),int(y + font_size * 15),int(x + font_size * 5),int(y + font_size * 1),fill)
-    
-
-def J(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 9),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 10),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 10),int(x + font_size * 7),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 3),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 3),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 10),fill)
-    
-    
-def K(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 9),int(x + font_size * 8),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 4),int(y + font_size * 7),int(x + font_size * 9),int(y + font_size * 15),fill)
-    
-
-def L(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 15),fill)
-    
-    
-def M(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 5),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 1),int(x + font_size * 5),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 1),fill)
-    
-
-def N(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 1),fill)
-    
-
-def O(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 10),int(y + font_size * 5),int(x + font_size * 8),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 8),int(y + font_size * 1),int(x + font_size * 4),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 4),int(y + font_size * 1),int(x + font_size * 2),int(y + font_size * 3),fill)
-    oled.line(int(x + font_size * 2),int(y + font_size * 3),int(x + font_size * 1),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 1),int(y + font_size * 12),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 12),int(x + font_size * 4),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 4),int(y + font_size * 15),int(x + font_size * 7),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 10),int(y + font_size * 12),fill)
-    oled.line(int(x + font_size * 10),int(y + font_size * 12),int(x + font_size * 10),int(y + font_size * 5),fill)
-    
-
-
-def P(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 7),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 7),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 4),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 4),int(x + font_size * 9),int(y + font_size * 6),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 6), (x + font_size * 6),int(y + font_size * 9),fill)
-    oled.line(int(x + font_size * 5),int(y + font_size * 9),int(x + font_size * 1),int(y + font_size * 9),fill)
-     
-
-def Q(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 10),int(y + font_size * 5),int(x + font_size * 8),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 8),int(y + font_size * 1),int(x + font_size * 4),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 4),int(y + font_size * 1),int(x + font_size * 2),int(y + font_size * 3),fill)
-    oled.line(int(x + font_size * 2),int(y + font_size * 3),int(x + font_size * 1),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 1),int(y + font_size * 12),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 12),int(x + font_size * 4),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 4),int(y + font_size * 15),int(x + font_size * 7),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 10),int(y + font_size * 12),fill)
-    oled.line(int(x + font_size * 10),int(y + font_size * 12),int(x + font_size * 10),int(y + font_size * 5),fill)
-    oled.line(int(x + font_size * 6),int(y + font_size * 10),int(x + font_size * 10),int(y + font_size * 15),fill)
-    
-
-def R(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 7),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 7),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 4),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 4),int(x + font_size * 9),int(y + font_size * 6),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 6), (x + font_size * 6),int(y + font_size * 9),fill)
-    oled.line(int(x + font_size * 5),int(y + font_size * 9),int(x + font_size * 1),int(y + font_size * 9),fill)
-    oled.line(int(x + font_size * 5),int(y + font_size * 9),int(x + font_size * 9),int(y + font_size * 15),fill)
-    
-    
-def S(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 9),int(y + font_size * 2),int(x + font_size * 7),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 7),int(y + font_size * 1),int(x + font_size * 3),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 3),int(y + font_size * 1),int(x + font_size * 2),int(y + font_size * 2),fill)
-    oled.line(int(x + font_size * 3),int(y + font_size * 1),int(x + font_size * 2),int(y + font_size * 2),fill)    
-    oled.line(int(x + font_size * 2),int(y + font_size * 2),int(x + font_size * 1),int(y + font_size * 5),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 5),int(x + font_size * 5),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 5),int(y + font_size * 7),int(x + font_size * 9),int(y + font_size * 8),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 8),int(x + font_size * 10),int(y + font_size * 11),fill)
-    oled.line(int(x + font_size * 10),int(y + font_size * 11),int(x + font_size * 10),int(y + font_size * 13),fill)
-    oled.line(int(x + font_size * 10),int(y + font_size * 13),int(x + font_size * 7),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 4),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 4),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 13),fill)
-    #oled.line(int(x + font_size * 10),int(y + font_size * 13),int(x + font_size * 7),int(y + font_size * 15),fill)
-    
-
-def T(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 5),int(y + font_size * 15),int(x + font_size * 5),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 1),fill)
-    
-    
-def U(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 1),int(y + font_size * 13),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 13),int(x + font_size * 3),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 3),int(y + font_size * 15),int(x + font_size * 7),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 13),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 13),int(x + font_size * 9),int(y + font_size * 1),fill)
-    
-
-def V(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 5),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 5),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 1),fill)
-    
-
-def W(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 3),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 3),int(y + font_size * 15),int(x + font_size * 5),int(y + font_size * 8),fill)
-    oled.line(int(x + font_size * 5),int(y + font_size * 8),int(x + font_size * 8),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 8),int(y + font_size * 15),int(x + font_size * 10),int(y + font_size * 1),fill)
-    
-
-def X(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 1),int(x + font_size * 1),int(y + font_size * 15),fill)
-    
-
-def Y(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 5),int(y + font_size * 15),int(x + font_size * 5),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 5),int(y + font_size * 7),int(x + font_size * 1),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 5),int(y + font_size * 7),int(x + font_size * 10),int(y + font_size * 1),fill)
-    
-
-def Z(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 15),fill)
-    
-
-# The symbols
-
-def period(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 14),int(x + font_size * 2),int(y + font_size * 14),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 2),int(y + font_size * 15),fill)
-    
-
-def exclam(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 14),int(x + font_size * 1),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 1),int(y + font_size * 10),fill)
-    
-
-def plus(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 5),int(y + font_size * 5),int(x + font_size * 5),int(y + font_size * 11),fill)
-    oled.line(int(x + font_size * 2),int(y + font_size * 8),int(x + font_size * 8),int(y + font_size * 8),fill)
-    
-    
-def minus(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 2),int(y + font_size * 8),int(x + font_size * 8),int(y + font_size * 8),fill)
-    
-    
-def equal(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 2),int(y + font_size * 6),int(x + font_size * 8),int(y + font_size * 6),fill)
-    oled.line(int(x + font_size * 2),int(y + font_size * 9),int(x + font_size * 8),int(y + font_size * 9),fill)
-    
-
-def comma(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 13),int(x + font_size * 1),int(y + font_size * 14),fill)
-    oled.line(int(x + font_size * 2),int(y + font_size * 13),int(x + font_size * 2),int(y + font_size * 17),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 17),int(x + font_size * 2),int(y + font_size * 17),fill)
-    
-
-def colon(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 14),int(x + font_size * 2),int(y + font_size * 14),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 2),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 6),int(x + font_size * 2),int(y + font_size * 6),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 5),int(x + font_size * 2),int(y + font_size * 5),fill)
-    
-
-
-def slash(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 9),int(y + font_size * 1),int(x + font_size * 1),int(y + font_size * 15),fill)
-    
-    
-def question(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 5),int(y + font_size * 14),int(x + font_size * 6),int(y + font_size * 14),fill)
-    oled.line(int(x + font_size * 5),int(y + font_size * 15),int(x + font_size * 6),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 5),int(y + font_size * 10),int(x + font_size * 5),int(y + font_size * 8),fill)
-    oled.line(int(x + font_size * 5),int(y + font_size * 8),int(x + font_size * 8),int(y + font_size * 6),fill)
-    oled.line(int(x + font_size * 8),int(y + font_size * 6),int(x + font_size * 9),int(y + font_size * 2),fill)
-    oled.line(int(x + font_size * 8),int(y + font_size * 1),int(x + font_size * 4),int(y + font_size * 1),fill)
-
-    
-
-
-def amp(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    #&
-    oled.line(int(x + font_size * 4),int(y + font_size * 7),int(x + font_size * 2),int(y + font_size * 5),fill)
-    oled.line(int(x + font_size * 2),int(y + font_size * 5),int(x + font_size * 2),int(y + font_size * 3),fill)
-    oled.line(int(x + font_size * 2),int(y + font_size * 3),int(x + font_size * 3),int(y + font_size * 2),fill)
-    oled.line(int(x + font_size * 3),int(y + font_size * 2),int(x + font_size * 4),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 4),int(y + font_size * 1),int(x + font_size * 6),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 6),int(y + font_size * 1),int(x + font_size * 7),int(y + font_size * 2),fill)
-    oled.line(int(x + font_size * 7),int(y + font_size * 2),int(x + font_size * 8),int(y + font_size * 3),fill)
-    oled.line(int(x + font_size * 8),int(y + font_size * 3),int(x + font_size * 8),int(y + font_size * 4),fill)
-    oled.line(int(x + font_size * 8),int(y + font_size * 4),int(x + font_size * 6),int(y + font_size * 6),fill)
-    oled.line(int(x + font_size * 6),int(y + font_size * 6),int(x + font_size * 1),int(y + font_size * 10),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 10),int(x + font_size * 1),int(y + font_size * 13),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 13),int(x + font_size * 3),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 3),int(y + font_size * 15),int(x + font_size * 6),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 6),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 9),fill)
-    oled.line(int(x + font_size * 4),int(y + font_size * 8),int(x + font_size * 10),int(y + font_size * 15),fill)
-    
-    
-
-# The numbers
-
-def zero(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 10),int(y + font_size * 5),int(x + font_size * 8),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 8),int(y + font_size * 1),int(x + font_size * 4),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 4),int(y + font_size * 1),int(x + font_size * 2),int(y + font_size * 3),fill)
-    oled.line(int(x + font_size * 2),int(y + font_size * 3),int(x + font_size * 1),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 1),int(y + font_size * 12),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 12),int(x + font_size * 4),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 4),int(y + font_size * 15),int(x + font_size * 7),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 10),int(y + font_size * 12),fill)
-    oled.line(int(x + font_size * 10),int(y + font_size * 12),int(x + font_size * 10),int(y + font_size * 5),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 4),int(x + font_size * 2),int(y + font_size * 12),fill)
-    
-
-def one(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 5),int(y + font_size * 15),int(x + font_size * 5),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 5),int(y + font_size * 1),int(x + font_size * 2),int(y + font_size * 3),fill)
-    
-
-def two(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 3),int(x + font_size * 2),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 2),int(y + font_size * 1),int(x + font_size * 7),int(y + font_size * 1),fill)    
-    oled.line(int(x + font_size * 7),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 3),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 3),int(x + font_size * 9),int(y + font_size * 6),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 6),int(x + font_size * 2),int(y + font_size * 13),fill)
-    oled.line(int(x + font_size * 2),int(y + font_size * 13),int(x + font_size * 1),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 10),int(y + font_size * 15),fill)
-    
-    
-
-def three(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 3),int(x + font_size * 2),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 2),int(y + font_size * 1),int(x + font_size * 7),int(y + font_size * 1),fill)    
-    oled.line(int(x + font_size * 7),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 3),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 3),int(x + font_size * 9),int(y + font_size * 5),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 5),int(x + font_size * 7),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 7),int(y + font_size * 7),int(x + font_size * 4),int(y + font_size * 7),fill)    
-    oled.line(int(x + font_size * 7),int(y + font_size * 8),int(x + font_size * 9),int(y + font_size * 9),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 9),int(x + font_size * 9),int(y + font_size * 12),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 12),int(x + font_size * 7),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 3),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 3),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 13),fill)    
-
-    
-
-def four(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 8),int(y + font_size * 1),int(x + font_size * 8),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 1),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 9),int(y + font_size * 7),fill)
-    
-
-def five(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 9),int(y + font_size * 1),int(x + font_size * 1),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 1),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 7),int(y + font_size * 7),int(x + font_size * 1),int(y + font_size * 7),fill)    
-    oled.line(int(x + font_size * 7),int(y + font_size * 8),int(x + font_size * 9),int(y + font_size * 9),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 9),int(x + font_size * 9),int(y + font_size * 12),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 12),int(x + font_size * 7),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 3),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 3),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 13),fill)
-    
-
-def six(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 10),int(y + font_size * 3),int(x + font_size * 8),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 8),int(y + font_size * 1),int(x + font_size * 4),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 4),int(y + font_size * 1),int(x + font_size * 2),int(y + font_size * 3),fill)
-    oled.line(int(x + font_size * 2),int(y + font_size * 3),int(x + font_size * 1),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 1),int(y + font_size * 12),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 12),int(x + font_size * 4),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 4),int(y + font_size * 15),int(x + font_size * 7),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 10),int(y + font_size * 13),fill)
-    oled.line(int(x + font_size * 10),int(y + font_size * 13),int(x + font_size * 10),int(y + font_size * 9),fill)
-    oled.line(int(x + font_size * 10),int(y + font_size * 9),int(x + font_size * 8),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 8),int(y + font_size * 7),int(x + font_size * 4),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 4),int(y + font_size * 7),int(x + font_size * 2),int(y + font_size * 9),fill)
-    
-    
-
-def seven(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 10),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 10),int(y + font_size * 1),int(x + font_size * 3),int(y + font_size * 15),fill)
-    
-    
-def eight(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 4),int(y + font_size * 7),int(x + font_size * 2),int(y + font_size * 5),fill)
-    oled.line(int(x + font_size * 2),int(y + font_size * 5),int(x + font_size * 2),int(y + font_size * 3),fill)
-    oled.line(int(x + font_size * 2),int(y + font_size * 3),int(x + font_size * 3),int(y + font_size * 2),fill)
-    oled.line(int(x + font_size * 3),int(y + font_size * 2),int(x + font_size * 4),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 4),int(y + font_size * 1),int(x + font_size * 6),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 6),int(y + font_size * 1),int(x + font_size * 7),int(y + font_size * 2),fill)
-    oled.line(int(x + font_size * 7),int(y + font_size * 2),int(x + font_size * 8),int(y + font_size * 3),fill)
-    oled.line(int(x + font_size * 8),int(y + font_size * 3),int(x + font_size * 8),int(y + font_size * 5),fill)
-    oled.line(int(x + font_size * 8),int(y + font_size * 5),int(x + font_size * 6),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 10),int(x + font_size * 1),int(y + font_size * 13),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 13),int(x + font_size * 3),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 3),int(y + font_size * 15),int(x + font_size * 7),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 13),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 13),int(x + font_size * 9),int(y + font_size * 10),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 10),int(x + font_size * 6),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 6),int(y + font_size * 7),int(x + font_size * 4),int(y + font_size * 7),fill)
-    oled.line(int(x + font_size * 4),int(y + font_size * 7),int(x + font_size * 2),int(y + font_size * 9),fill)
-    
-
-def nine(x, y, oled, font_size=2, fill=1):
-    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
-
-
-    oled.line(int(x + font_size * 10),int(y + font_size * 6),int(x + font_size * 8),int(y + font_size * 8),fill)
-    oled.line(int(x + font_size * 8),int(y + font_size * 8),int(x + font_size * 3),int(y + font_size * 8),fill)
-    oled.line(int(x + font_size * 3),int(y + font_size * 8),int(x + font_size * 1),int(y + font_size * 5),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 5),int(x + font_size * 1),int(y + font_size * 3),fill)
-    oled.line(int(x + font_size * 1),int(y + font_size * 3),int(x + font_size * 3),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 3),int(y + font_size * 1),int(x + font_size * 8),int(y + font_size * 1),fill)
-    oled.line(int(x + font_size * 8),int(y + font_size * 1),int(x + font_size * 10),int(y + font_size * 3),fill)
-    oled.line(int(x + font_size * 10),int(y + font_size * 3),int(x + font_size * 10),int(y + font_size * 10),fill)
-    oled.line(int(x + font_size * 10),int(y + font_size * 10),int(x + font_size * 9),int(y + font_size * 13),fill)
-    oled.line(int(x + font_size * 9),int(y + font_size * 13),int(x + font_size * 7),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 3),int(y + font_size * 15),fill)
-    oled.line(int(x + font_size * 3),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 13),fill)
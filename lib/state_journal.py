@@ -0,0 +1,104 @@
+# Append-only binary journal for the light state
+#
+# Each state change appends one fixed-size record instead of rewriting config.json,
+# so a save costs RECORD_SIZE bytes of flash. When the journal holds max_records
+# records it is compacted down to the latest one.
+
+import os
+import struct
+
+# seq, brightness (x1000), mode index, checksum, packed rgb
+RECORD_FORMAT = "<IHBBI"
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+MODE_UNKNOWN = 0xFF
+
+
+def _checksum(seq, brightness, mode, rgb):
+    return (seq + (seq >> 8) + (seq >> 16) + (seq >> 24)
+            + brightness + (brightness >> 8) + mode
+            + rgb + (rgb >> 8) + (rgb >> 16) + 0x5A) & 0xFF
+
+
+def pack_rgb(rgb):
+    # "r,g,b" -> 0xRRGGBB
+    r, g, b = [int(value) for value in rgb.split(",")]
+    return (r & 0xFF) << 16 | (g & 0xFF) << 8 | (b & 0xFF)
+
+
+def unpack_rgb(packed):
+    # 0xRRGGBB -> "r,g,b"
+    return "{},{},{}".format((packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF)
+
+
+class StateJournal:
+    def __init__(self, modes, path="state.bin", max_records=256):
+        self.modes = modes
+        self.path = path
+        self.max_records = max_records
+        self.seq = 0
+        self.count = 0
+        self.record = bytearray(RECORD_SIZE)
+
+    def load(self):
+        # Replay the journal, returns (brightness, mode, rgb) of the latest valid record or None
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        latest = None
+        latest_offset = 0
+        self.count = 0
+        for offset in range(0, len(data) - RECORD_SIZE + 1, RECORD_SIZE):
+            seq, brightness, mode, check, rgb = struct.unpack_from(RECORD_FORMAT, data, offset)
+            if check != _checksum(seq, brightness, mode, rgb):
+                break  # torn write at the end of the journal
+            self.count += 1
+            if latest is None or seq >= latest[0]:
+                latest = (seq, brightness, mode, rgb)
+                latest_offset = offset
+        if self.count * RECORD_SIZE != len(data):
+            # Drop the torn tail now, later appends would land after it and never be replayed
+            if latest is None:
+                os.remove(self.path)
+                self.count = 0
+                return None
+            self.record[:] = data[latest_offset:latest_offset + RECORD_SIZE]
+            self.compact()
+        if latest is None:
+            return None
+        self.seq = latest[0]
+        mode = self.modes[latest[2]] if latest[2] < len(self.modes) else None
+        return (latest[1] / 1000, mode, unpack_rgb(latest[3]))
+
+    def append(self, brightness, mode, rgb):
+        self.seq = (self.seq + 1) & 0xFFFFFFFF
+        self._pack(brightness, mode, rgb)
+        if self.count >= self.max_records:
+            self.compact()
+            return
+        with open(self.path, "ab") as f:
+            f.write(self.record)
+        self.count += 1
+
+    def compact(self):
+        # Rewrite the journal with only the latest record (already packed in self.record)
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(self.record)
+        try:
+            os.rename(temp_path, self.path)
+        except OSError:
+            os.remove(self.path)
+            os.rename(temp_path, self.path)
+        self.count = 1
+
+    def _pack(self, brightness, mode, rgb):
+        brightness = min(max(int(brightness * 1000), 0), 0xFFFF)
+        try:
+            mode = self.modes.index(mode)
+        except ValueError:
+            mode = MODE_UNKNOWN
+        rgb = pack_rgb(rgb)
+        struct.pack_into(RECORD_FORMAT, self.record, 0, self.seq, brightness, mode,
+                         _checksum(self.seq, brightness, mode, rgb), rgb)
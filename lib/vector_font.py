@@ -0,0 +1,610 @@
+# Vector font for the SSD1306 driver, every glyph is drawn as a set of lines
+#
+# Used by SSD1306.wrap() when no bitmap font is loaded for the requested size, and by
+# tools/build_font.py to render font.bin. Imported lazily so the glyphs only take
+# heap on stands that need them.
+
+
+def wrap(oled, text, x, y, font_size=2, fill=1):
+    # Loop through each character in the text and call the corresponding function
+    for char in text:
+        glyph = GLYPHS.get(char)
+        if glyph is not None:
+            glyph(x, y, oled, font_size, fill)
+        x = x + (font_size * 5)
+
+
+# The Alphabets
+
+def A(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 5),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 5),int(y + font_size * 1),int(x + font_size * 10),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 3),int(y + font_size * 11),int(x + font_size * 8),int(y + font_size * 11),fill)
+
+    
+    
+def B(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 6),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 6),int(y + font_size * 1),int(x + font_size * 8),int(y + font_size * 3),fill)
+    oled.line(int(x + font_size * 8),int(y + font_size * 3),int(x + font_size * 8),int(y + font_size * 4),fill)
+    oled.line(int(x + font_size * 8),int(y + font_size * 4),int(x + font_size * 6),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 5),int(y + font_size * 7),int(x + font_size * 1),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 6),int(y + font_size * 7),int(x + font_size * 9),int(y + font_size * 10),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 10),int(x + font_size * 9),int(y + font_size * 12),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 12),int(x + font_size * 6),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 6),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 15),fill)
+        
+    
+def C(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 10),int(y + font_size * 2),int(x + font_size * 9),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 1),int(x + font_size * 4),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 4),int(y + font_size * 1),int(x + font_size * 2),int(y + font_size * 3),fill)
+    oled.line(int(x + font_size * 2),int(y + font_size * 3),int(x + font_size * 1),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 1),int(y + font_size * 12),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 12),int(x + font_size * 4),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 4),int(y + font_size * 15),int(x + font_size * 8),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 8),int(y + font_size * 15),int(x + font_size * 10),int(y + font_size * 13),fill)
+    
+    
+def D(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 6),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 6),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 3),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 3),int(x + font_size * 9),int(y + font_size * 12),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 12),int(x + font_size * 6),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 6),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 15),fill)
+    
+    
+def E(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 7),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 15),fill)
+    
+    
+def F(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 6),int(y + font_size * 7),fill)
+    
+    
+def G(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 9),int(y + font_size * 2),int(x + font_size * 8),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 8),int(y + font_size * 1),int(x + font_size * 4),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 4),int(y + font_size * 1),int(x + font_size * 2),int(y + font_size * 3),fill)
+    oled.line(int(x + font_size * 2),int(y + font_size * 3),int(x + font_size * 1),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 1),int(y + font_size * 12),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 12),int(x + font_size * 4),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 4),int(y + font_size * 15),int(x + font_size * 8),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 8),int(y + font_size * 15),int(x + font_size * 10),int(y + font_size * 13),fill)
+    oled.line(int(x + font_size * 10),int(y + font_size * 13),int(x + font_size * 10),int(y + font_size * 9),fill)
+    oled.line(int(x + font_size * 10),int(y + font_size * 9),int(x + font_size * 6),int(y + font_size * 9),fill)    
+    
+
+def H(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 9),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 1),fill)
+    
+
+def I(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 5),int(y + font_size * 15),int(x + font_size * 5),int(y + font_size * 1),fill)
+    
+
+def J(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 9),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 10),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 10),int(x + font_size * 7),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 3),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 3),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 10),fill)
+    
+    
+def K(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 9),int(x + font_size * 8),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 4),int(y + font_size * 7),int(x + font_size * 9),int(y + font_size * 15),fill)
+    
+
+def L(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 15),fill)
+    
+    
+def M(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 5),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 1),int(x + font_size * 5),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 1),fill)
+    
+
+def N(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 1),fill)
+    
+
+def O(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 10),int(y + font_size * 5),int(x + font_size * 8),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 8),int(y + font_size * 1),int(x + font_size * 4),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 4),int(y + font_size * 1),int(x + font_size * 2),int(y + font_size * 3),fill)
+    oled.line(int(x + font_size * 2),int(y + font_size * 3),int(x + font_size * 1),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 1),int(y + font_size * 12),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 12),int(x + font_size * 4),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 4),int(y + font_size * 15),int(x + font_size * 7),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 10),int(y + font_size * 12),fill)
+    oled.line(int(x + font_size * 10),int(y + font_size * 12),int(x + font_size * 10),int(y + font_size * 5),fill)
+    
+
+
+def P(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 7),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 7),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 4),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 4),int(x + font_size * 9),int(y + font_size * 6),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 6),int(x + font_size * 6),int(y + font_size * 9),fill)
+    oled.line(int(x + font_size * 5),int(y + font_size * 9),int(x + font_size * 1),int(y + font_size * 9),fill)
+     
+
+def Q(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 10),int(y + font_size * 5),int(x + font_size * 8),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 8),int(y + font_size * 1),int(x + font_size * 4),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 4),int(y + font_size * 1),int(x + font_size * 2),int(y + font_size * 3),fill)
+    oled.line(int(x + font_size * 2),int(y + font_size * 3),int(x + font_size * 1),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 1),int(y + font_size * 12),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 12),int(x + font_size * 4),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 4),int(y + font_size * 15),int(x + font_size * 7),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 10),int(y + font_size * 12),fill)
+    oled.line(int(x + font_size * 10),int(y + font_size * 12),int(x + font_size * 10),int(y + font_size * 5),fill)
+    oled.line(int(x + font_size * 6),int(y + font_size * 10),int(x + font_size * 10),int(y + font_size * 15),fill)
+    
+
+def R(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 7),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 7),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 4),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 4),int(x + font_size * 9),int(y + font_size * 6),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 6),int(x + font_size * 6),int(y + font_size * 9),fill)
+    oled.line(int(x + font_size * 5),int(y + font_size * 9),int(x + font_size * 1),int(y + font_size * 9),fill)
+    oled.line(int(x + font_size * 5),int(y + font_size * 9),int(x + font_size * 9),int(y + font_size * 15),fill)
+    
+    
+def S(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 9),int(y + font_size * 2),int(x + font_size * 7),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 7),int(y + font_size * 1),int(x + font_size * 3),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 3),int(y + font_size * 1),int(x + font_size * 2),int(y + font_size * 2),fill)
+    oled.line(int(x + font_size * 3),int(y + font_size * 1),int(x + font_size * 2),int(y + font_size * 2),fill)    
+    oled.line(int(x + font_size * 2),int(y + font_size * 2),int(x + font_size * 1),int(y + font_size * 5),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 5),int(x + font_size * 5),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 5),int(y + font_size * 7),int(x + font_size * 9),int(y + font_size * 8),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 8),int(x + font_size * 10),int(y + font_size * 11),fill)
+    oled.line(int(x + font_size * 10),int(y + font_size * 11),int(x + font_size * 10),int(y + font_size * 13),fill)
+    oled.line(int(x + font_size * 10),int(y + font_size * 13),int(x + font_size * 7),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 4),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 4),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 13),fill)
+    #oled.line(int(x + font_size * 10),int(y + font_size * 13),int(x + font_size * 7),int(y + font_size * 15),fill)
+    
+
+def T(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 5),int(y + font_size * 15),int(x + font_size * 5),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 1),fill)
+    
+    
+def U(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 1),int(y + font_size * 13),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 13),int(x + font_size * 3),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 3),int(y + font_size * 15),int(x + font_size * 7),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 13),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 13),int(x + font_size * 9),int(y + font_size * 1),fill)
+    
+
+def V(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 5),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 5),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 1),fill)
+    
+
+def W(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 3),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 3),int(y + font_size * 15),int(x + font_size * 5),int(y + font_size * 8),fill)
+    oled.line(int(x + font_size * 5),int(y + font_size * 8),int(x + font_size * 8),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 8),int(y + font_size * 15),int(x + font_size * 10),int(y + font_size * 1),fill)
+    
+
+def X(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 1),int(x + font_size * 1),int(y + font_size * 15),fill)
+    
+
+def Y(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 5),int(y + font_size * 15),int(x + font_size * 5),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 5),int(y + font_size * 7),int(x + font_size * 1),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 5),int(y + font_size * 7),int(x + font_size * 10),int(y + font_size * 1),fill)
+    
+
+def Z(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 15),fill)
+    
+
+# The symbols
+
+def period(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 14),int(x + font_size * 2),int(y + font_size * 14),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 2),int(y + font_size * 15),fill)
+    
+
+def exclam(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 14),int(x + font_size * 1),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 1),int(y + font_size * 10),fill)
+    
+
+def plus(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 5),int(y + font_size * 5),int(x + font_size * 5),int(y + font_size * 11),fill)
+    oled.line(int(x + font_size * 2),int(y + font_size * 8),int(x + font_size * 8),int(y + font_size * 8),fill)
+    
+    
+def minus(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 2),int(y + font_size * 8),int(x + font_size * 8),int(y + font_size * 8),fill)
+    
+    
+def equal(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 2),int(y + font_size * 6),int(x + font_size * 8),int(y + font_size * 6),fill)
+    oled.line(int(x + font_size * 2),int(y + font_size * 9),int(x + font_size * 8),int(y + font_size * 9),fill)
+    
+
+def comma(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 13),int(x + font_size * 1),int(y + font_size * 14),fill)
+    oled.line(int(x + font_size * 2),int(y + font_size * 13),int(x + font_size * 2),int(y + font_size * 17),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 17),int(x + font_size * 2),int(y + font_size * 17),fill)
+    
+
+def colon(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 14),int(x + font_size * 2),int(y + font_size * 14),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 2),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 6),int(x + font_size * 2),int(y + font_size * 6),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 5),int(x + font_size * 2),int(y + font_size * 5),fill)
+    
+
+
+def slash(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 9),int(y + font_size * 1),int(x + font_size * 1),int(y + font_size * 15),fill)
+    
+    
+def question(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 5),int(y + font_size * 14),int(x + font_size * 6),int(y + font_size * 14),fill)
+    oled.line(int(x + font_size * 5),int(y + font_size * 15),int(x + font_size * 6),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 5),int(y + font_size * 10),int(x + font_size * 5),int(y + font_size * 8),fill)
+    oled.line(int(x + font_size * 5),int(y + font_size * 8),int(x + font_size * 8),int(y + font_size * 6),fill)
+    oled.line(int(x + font_size * 8),int(y + font_size * 6),int(x + font_size * 9),int(y + font_size * 2),fill)
+    oled.line(int(x + font_size * 8),int(y + font_size * 1),int(x + font_size * 4),int(y + font_size * 1),fill)
+
+    
+
+
+def amp(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    #&
+    oled.line(int(x + font_size * 4),int(y + font_size * 7),int(x + font_size * 2),int(y + font_size * 5),fill)
+    oled.line(int(x + font_size * 2),int(y + font_size * 5),int(x + font_size * 2),int(y + font_size * 3),fill)
+    oled.line(int(x + font_size * 2),int(y + font_size * 3),int(x + font_size * 3),int(y + font_size * 2),fill)
+    oled.line(int(x + font_size * 3),int(y + font_size * 2),int(x + font_size * 4),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 4),int(y + font_size * 1),int(x + font_size * 6),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 6),int(y + font_size * 1),int(x + font_size * 7),int(y + font_size * 2),fill)
+    oled.line(int(x + font_size * 7),int(y + font_size * 2),int(x + font_size * 8),int(y + font_size * 3),fill)
+    oled.line(int(x + font_size * 8),int(y + font_size * 3),int(x + font_size * 8),int(y + font_size * 4),fill)
+    oled.line(int(x + font_size * 8),int(y + font_size * 4),int(x + font_size * 6),int(y + font_size * 6),fill)
+    oled.line(int(x + font_size * 6),int(y + font_size * 6),int(x + font_size * 1),int(y + font_size * 10),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 10),int(x + font_size * 1),int(y + font_size * 13),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 13),int(x + font_size * 3),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 3),int(y + font_size * 15),int(x + font_size * 6),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 6),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 9),fill)
+    oled.line(int(x + font_size * 4),int(y + font_size * 8),int(x + font_size * 10),int(y + font_size * 15),fill)
+    
+    
+
+# The numbers
+
+def zero(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 10),int(y + font_size * 5),int(x + font_size * 8),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 8),int(y + font_size * 1),int(x + font_size * 4),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 4),int(y + font_size * 1),int(x + font_size * 2),int(y + font_size * 3),fill)
+    oled.line(int(x + font_size * 2),int(y + font_size * 3),int(x + font_size * 1),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 1),int(y + font_size * 12),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 12),int(x + font_size * 4),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 4),int(y + font_size * 15),int(x + font_size * 7),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 10),int(y + font_size * 12),fill)
+    oled.line(int(x + font_size * 10),int(y + font_size * 12),int(x + font_size * 10),int(y + font_size * 5),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 4),int(x + font_size * 2),int(y + font_size * 12),fill)
+    
+
+def one(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 5),int(y + font_size * 15),int(x + font_size * 5),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 5),int(y + font_size * 1),int(x + font_size * 2),int(y + font_size * 3),fill)
+    
+
+def two(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 3),int(x + font_size * 2),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 2),int(y + font_size * 1),int(x + font_size * 7),int(y + font_size * 1),fill)    
+    oled.line(int(x + font_size * 7),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 3),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 3),int(x + font_size * 9),int(y + font_size * 6),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 6),int(x + font_size * 2),int(y + font_size * 13),fill)
+    oled.line(int(x + font_size * 2),int(y + font_size * 13),int(x + font_size * 1),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 15),int(x + font_size * 10),int(y + font_size * 15),fill)
+    
+    
+
+def three(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 3),int(x + font_size * 2),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 2),int(y + font_size * 1),int(x + font_size * 7),int(y + font_size * 1),fill)    
+    oled.line(int(x + font_size * 7),int(y + font_size * 1),int(x + font_size * 9),int(y + font_size * 3),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 3),int(x + font_size * 9),int(y + font_size * 5),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 5),int(x + font_size * 7),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 7),int(y + font_size * 7),int(x + font_size * 4),int(y + font_size * 7),fill)    
+    oled.line(int(x + font_size * 7),int(y + font_size * 8),int(x + font_size * 9),int(y + font_size * 9),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 9),int(x + font_size * 9),int(y + font_size * 12),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 12),int(x + font_size * 7),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 3),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 3),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 13),fill)    
+
+    
+
+def four(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 8),int(y + font_size * 1),int(x + font_size * 8),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 1),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 9),int(y + font_size * 7),fill)
+    
+
+def five(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 9),int(y + font_size * 1),int(x + font_size * 1),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 1),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 7),int(y + font_size * 7),int(x + font_size * 1),int(y + font_size * 7),fill)    
+    oled.line(int(x + font_size * 7),int(y + font_size * 8),int(x + font_size * 9),int(y + font_size * 9),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 9),int(x + font_size * 9),int(y + font_size * 12),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 12),int(x + font_size * 7),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 3),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 3),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 13),fill)
+    
+
+def six(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 10),int(y + font_size * 3),int(x + font_size * 8),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 8),int(y + font_size * 1),int(x + font_size * 4),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 4),int(y + font_size * 1),int(x + font_size * 2),int(y + font_size * 3),fill)
+    oled.line(int(x + font_size * 2),int(y + font_size * 3),int(x + font_size * 1),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 7),int(x + font_size * 1),int(y + font_size * 12),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 12),int(x + font_size * 4),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 4),int(y + font_size * 15),int(x + font_size * 7),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 10),int(y + font_size * 13),fill)
+    oled.line(int(x + font_size * 10),int(y + font_size * 13),int(x + font_size * 10),int(y + font_size * 9),fill)
+    oled.line(int(x + font_size * 10),int(y + font_size * 9),int(x + font_size * 8),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 8),int(y + font_size * 7),int(x + font_size * 4),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 4),int(y + font_size * 7),int(x + font_size * 2),int(y + font_size * 9),fill)
+    
+    
+
+def seven(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 1),int(y + font_size * 1),int(x + font_size * 10),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 10),int(y + font_size * 1),int(x + font_size * 3),int(y + font_size * 15),fill)
+    
+    
+def eight(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 4),int(y + font_size * 7),int(x + font_size * 2),int(y + font_size * 5),fill)
+    oled.line(int(x + font_size * 2),int(y + font_size * 5),int(x + font_size * 2),int(y + font_size * 3),fill)
+    oled.line(int(x + font_size * 2),int(y + font_size * 3),int(x + font_size * 3),int(y + font_size * 2),fill)
+    oled.line(int(x + font_size * 3),int(y + font_size * 2),int(x + font_size * 4),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 4),int(y + font_size * 1),int(x + font_size * 6),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 6),int(y + font_size * 1),int(x + font_size * 7),int(y + font_size * 2),fill)
+    oled.line(int(x + font_size * 7),int(y + font_size * 2),int(x + font_size * 8),int(y + font_size * 3),fill)
+    oled.line(int(x + font_size * 8),int(y + font_size * 3),int(x + font_size * 8),int(y + font_size * 5),fill)
+    oled.line(int(x + font_size * 8),int(y + font_size * 5),int(x + font_size * 6),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 10),int(x + font_size * 1),int(y + font_size * 13),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 13),int(x + font_size * 3),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 3),int(y + font_size * 15),int(x + font_size * 7),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 9),int(y + font_size * 13),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 13),int(x + font_size * 9),int(y + font_size * 10),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 10),int(x + font_size * 6),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 6),int(y + font_size * 7),int(x + font_size * 4),int(y + font_size * 7),fill)
+    oled.line(int(x + font_size * 4),int(y + font_size * 7),int(x + font_size * 2),int(y + font_size * 9),fill)
+    
+
+def nine(x, y, oled, font_size=2, fill=1):
+    font_size = font_size / 3  # divide by 3, which is the smallest visible font size
+
+
+    oled.line(int(x + font_size * 10),int(y + font_size * 6),int(x + font_size * 8),int(y + font_size * 8),fill)
+    oled.line(int(x + font_size * 8),int(y + font_size * 8),int(x + font_size * 3),int(y + font_size * 8),fill)
+    oled.line(int(x + font_size * 3),int(y + font_size * 8),int(x + font_size * 1),int(y + font_size * 5),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 5),int(x + font_size * 1),int(y + font_size * 3),fill)
+    oled.line(int(x + font_size * 1),int(y + font_size * 3),int(x + font_size * 3),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 3),int(y + font_size * 1),int(x + font_size * 8),int(y + font_size * 1),fill)
+    oled.line(int(x + font_size * 8),int(y + font_size * 1),int(x + font_size * 10),int(y + font_size * 3),fill)
+    oled.line(int(x + font_size * 10),int(y + font_size * 3),int(x + font_size * 10),int(y + font_size * 10),fill)
+    oled.line(int(x + font_size * 10),int(y + font_size * 10),int(x + font_size * 9),int(y + font_size * 13),fill)
+    oled.line(int(x + font_size * 9),int(y + font_size * 13),int(x + font_size * 7),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 7),int(y + font_size * 15),int(x + font_size * 3),int(y + font_size * 15),fill)
+    oled.line(int(x + font_size * 3),int(y + font_size * 15),int(x + font_size * 1),int(y + font_size * 13),fill)
+
+
+GLYPHS = {
+    'A': A, 'a': A,
+    'B': B, 'b': B,
+    'C': C, 'c': C,
+    'D': D, 'd': D,
+    'E': E, 'e': E,
+    'F': F, 'f': F,
+    'G': G, 'g': G,
+    'H': H, 'h': H,
+    'I': I, 'i': I,
+    'J': J, 'j': J,
+    'K': K, 'k': K,
+    'L': L, 'l': L,
+    'M': M, 'm': M,
+    'N': N, 'n': N,
+    'O': O, 'o': O,
+    'P': P, 'p': P,
+    'Q': Q, 'q': Q,
+    'R': R, 'r': R,
+    'S': S, 's': S,
+    'T': T, 't': T,
+    'U': U, 'u': U,
+    'V': V, 'v': V,
+    'W': W, 'w': W,
+    'X': X, 'x': X,
+    'Y': Y, 'y': Y,
+    'Z': Z, 'z': Z,
+    '0': zero,
+    '1': one,
+    '2': two,
+    '3': three,
+    '4': four,
+    '5': five,
+    '6': six,
+    '7': seven,
+    '8': eight,
+    '9': nine,
+    '.': period,
+    '!': exclam,
+    '?': question,
+    '/': slash,
+    ':': colon,
+    ',': comma,
+    '&': amp,
+    '+': plus,
+    '-': minus,
+    '=': equal,
+}
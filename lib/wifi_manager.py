@@ -0,0 +1,188 @@
+# Non-blocking WiFi connection manager
+#
+# Drives the station interface through explicit states with timeouts and retries:
+#   idle -> scanning -> associating -> dhcp -> online
+# The BSSID and channel of the last access point are cached in flash so a reconnect
+# (e.g. after a router reboot) goes straight to associating without a scan.
+
+import time
+import ujson
+import ubinascii
+import uasyncio as asyncio
+
+IDLE = "idle"
+SCANNING = "scanning"
+ASSOCIATING = "associating"
+DHCP = "dhcp"
+ONLINE = "online"
+
+NTP_DELTA = 3155673600 if time.gmtime(0)[0] == 2000 else 2208988800
+
+
+class WiFiManager:
+    def __init__(self, wlan, ssid, password, static_ip=None, cache_path="wifi.json",
+                 connect_timeout=10000, dhcp_timeout=10000, retries=3, max_backoff=30000):
+        self.wlan = wlan
+        self.ssid = ssid
+        self.password = password
+        self.static_ip = tuple(static_ip) if static_ip else None
+        self.cache_path = cache_path
+        self.connect_timeout = connect_timeout
+        self.dhcp_timeout = dhcp_timeout
+        self.retries = retries
+        self.max_backoff = max_backoff
+        self.on_online = None  # called (not awaited) on every transition to online
+        self.state = IDLE
+        self.failures = 0
+        self.cache = self._load_cache()
+        self._since = time.ticks_ms()
+
+    @property
+    def online(self):
+        return self.state == ONLINE
+
+    def start(self):
+        # Kick off association right away, run() picks up from here
+        if self.cache is not None:
+            self._associate()
+        else:
+            self._set_state(SCANNING)
+
+    async def run(self):
+        while True:
+            if self.state == IDLE:
+                self.start()
+            elif self.state == SCANNING:
+                self._scan()
+            elif self.state == ASSOCIATING:
+                await self._check_associating()
+            elif self.state == DHCP:
+                self._check_dhcp()
+            elif self.state == ONLINE:
+                if not self.wlan.isconnected():
+                    print("WiFi: link lost, reconnecting")
+                    self._associate()
+                await asyncio.sleep_ms(500)
+                continue
+            await asyncio.sleep_ms(100)
+
+    def _set_state(self, state):
+        self.state = state
+        self._since = time.ticks_ms()
+
+    def _elapsed(self):
+        return time.ticks_diff(time.ticks_ms(), self._since)
+
+    def _scan(self):
+        # Blocking scan, only needed when there is no cached access point
+        try:
+            networks = [n for n in self.wlan.scan() if n[0].decode() == self.ssid]
+        except OSError:
+            networks = []
+        if networks:
+            best = max(networks, key=lambda n: n[3])  # strongest RSSI
+            self._save_cache(best[1], best[2])
+        self._associate()
+
+    def _associate(self):
+        try:
+            self.wlan.disconnect()
+        except OSError:
+            pass
+        if self.static_ip is not None:
+            self.wlan.ifconfig(self.static_ip)
+        try:
+            if self.cache is not None:
+                self.wlan.connect(self.ssid, self.password, bssid=self.cache[0])
+            else:
+                self.wlan.connect(self.ssid, self.password)
+        except OSError:
+            pass
+        self._set_state(ASSOCIATING)
+
+    async def _check_associating(self):
+        if self.wlan.isconnected():
+            self._set_state(DHCP)
+        elif self._elapsed() > self.connect_timeout:
+            await self._failed()
+
+    def _check_dhcp(self):
+        if self.static_ip is not None or self.wlan.ifconfig()[0] != "0.0.0.0":
+            self.failures = 0
+            self._set_state(ONLINE)
+            print("WiFi Connected:", self.wlan.ifconfig()[0])
+            if self.on_online is not None:
+                self.on_online()
+        elif self._elapsed() > self.dhcp_timeout:
+            self._associate()
+
+    async def _failed(self):
+        self.failures += 1
+        if self.cache is not None and self.failures >= self.retries:
+            # The cached access point is gone, scan for a new one
+            print("WiFi: cached access point unreachable, scanning")
+            self._drop_cache()
+            self.failures = 0
+            self._set_state(SCANNING)
+            return
+        if self.failures >= self.retries:
+            backoff = min(1000 << (self.failures - self.retries), self.max_backoff)
+            await asyncio.sleep_ms(backoff)
+        self._associate()
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, "r") as f:
+                cache = ujson.load(f)
+            if cache["ssid"] != self.ssid:
+                return None
+            return (ubinascii.unhexlify(cache["bssid"]), cache["channel"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _save_cache(self, bssid, channel):
+        if self.cache == (bssid, channel):
+            return  # avoid rewriting flash for an unchanged access point
+        self.cache = (bssid, channel)
+        try:
+            with open(self.cache_path, "w") as f:
+                ujson.dump({"ssid": self.ssid, "bssid": ubinascii.hexlify(bssid).decode(), "channel": channel}, f)
+        except OSError:
+            pass
+
+    def _drop_cache(self):
+        self.cache = None
+        try:
+            import os
+            os.remove(self.cache_path)
+        except OSError:
+            pass
+
+
+async def ntp_settime(host="pool.ntp.org", timeout=2000):
+    # Same as ntptime.settime(), but waits for the reply without blocking the event loop
+    import usocket as socket
+    import ustruct as struct
+    from machine import RTC
+
+    query = bytearray(48)
+    query[0] = 0x1B
+    addr = socket.getaddrinfo(host, 123)[0][-1]
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        s.setblocking(False)
+        s.sendto(query, addr)
+        start = time.ticks_ms()
+        while True:
+            try:
+                msg = s.recv(48)
+                break
+            except OSError:
+                if time.ticks_diff(time.ticks_ms(), start) > timeout:
+                    raise
+                await asyncio.sleep_ms(20)
+    finally:
+        s.close()
+    t = struct.unpack("!I", msg[40:44])[0] - NTP_DELTA
+    tm = time.gmtime(t)
+    RTC().datetime((tm[0], tm[1], tm[2], tm[6] + 1, tm[3], tm[4], tm[5], 0))
@@ -1,15 +1,33 @@
-from machine import Pin, SoftI2C, RTC
+from machine import Pin, I2C, SoftI2C, RTC
 from neopixel import NeoPixel
 import time
 import ujson
 import math
-import async_urequests as requests
-import urandom
-import ssd1306
 import uasyncio as asyncio
-from umqtt.simple import MQTTClient
 import network
 import ubinascii
+import os
+import micropython
+import sys
+import effects
+from effects import interpolate_color, FRAME_IDLE_MS
+from state_journal import StateJournal
+from wifi_manager import WiFiManager, ntp_settime
+
+# async_urequests, ssd1306 and umqtt are imported lazily by the background tasks,
+# so the LEDs can restore their state before the heavier modules are loaded
+requests = None
+http_session = None
+
+# Boot phase timestamps (ms since reset) to measure time-to-first-light
+boot_times = {}
+
+def boot_mark(phase):
+    if phase not in boot_times:
+        boot_times[phase] = time.ticks_ms()
+        print("Boot:", phase, "at", boot_times[phase], "ms")
+
+boot_mark("main")
 
 # Load config.json
 try:
@@ -18,6 +36,12 @@ try:
 except OSError:
     print("Unable to load config.json, file may be missing")
 
+# Delay (ms) the state must stay unchanged before it is written to flash
+try:
+    CONFIG_SAVE_DELAY = config["save_delay"]
+except KeyError:
+    CONFIG_SAVE_DELAY = 2000
+
 # Read MQTT settings
 try:
     MQTT_BROKER = config["mqtt_broker"]
@@ -28,11 +52,19 @@ except KeyError:
     print("Missing or incorrect MQTT settings in config")
 
 # Read Device configuarations
+# "devices" is either one light for the whole strip or a list of segments:
+#   [{"name": "Left", "pixels": [0, 15], "mode": "rainbow"}, {"name": "Right", "pixels": [15, 30], "mode": "static"}]
 try:
     devices_config = config["devices"]
-    DEVICE_NAME = devices_config["name"]
-    DEVICE_TYPE = devices_config["type"]
-except KeyError:
+    if isinstance(devices_config, list):
+        segments_config = devices_config
+        DEVICE_NAME = config.get("name", segments_config[0]["name"])
+        DEVICE_TYPE = segments_config[0].get("type", "light")
+    else:
+        segments_config = [devices_config]
+        DEVICE_NAME = devices_config["name"]
+        DEVICE_TYPE = devices_config["type"]
+except (KeyError, IndexError):
     print("Missing or incorrect Device configuration in config")    
     
 # Generate a unique ID from MAC address
@@ -40,131 +72,577 @@ MAC_ADDRESS = ubinascii.hexlify(network.WLAN().config('mac')).decode().replace("
 UNIQUE_ID = "1us" + MAC_ADDRESS # suffix + MAC_ADDRESS
 print("Device ID: "+UNIQUE_ID)
 
-# Define MQTT Topic Path
-MQTT_CONFIG_TOPIC = "homeassistant/" + DEVICE_TYPE + "/" + UNIQUE_ID + "/config"
-MQTT_STATE_TOPIC = "homeassistant/" + DEVICE_TYPE + "/" + UNIQUE_ID + "/status"
-MQTT_SET_TOPIC = "homeassistant/" + DEVICE_TYPE + "/" + UNIQUE_ID + "/set"
+# Define MQTT Topic Path, the light topics are defined per segment by Segment
+MQTT_AVAILABILITY_TOPIC = "homeassistant/" + DEVICE_TYPE + "/" + UNIQUE_ID + "/availability"
 
-MQTT_BRIGHTNESS_TOPIC = "homeassistant/" + DEVICE_TYPE + "/" + UNIQUE_ID + "/brightness"
-MQTT_BRIGHTNESS_STATE_TOPIC = "homeassistant/" + DEVICE_TYPE + "/" + UNIQUE_ID + "/brightnessstatus"
+# Wireless charger entities, published next to the light on the same connection
+MQTT_CHARGER_CONFIG_TOPIC = "homeassistant/binary_sensor/" + UNIQUE_ID + "/config"
+MQTT_CHARGER_STATE_TOPIC = "homeassistant/binary_sensor/" + UNIQUE_ID + "/status"
+MQTT_CHARGE_SESSION_CONFIG_TOPIC = "homeassistant/sensor/" + UNIQUE_ID + "/config"
+MQTT_CHARGE_SESSION_STATE_TOPIC = "homeassistant/sensor/" + UNIQUE_ID + "/status"
+MQTT_CHARGE_SESSION_ATTRIBUTES_TOPIC = "homeassistant/sensor/" + UNIQUE_ID + "/attributes"
 
-MQTT_COLORTEMP_TOPIC = "homeassistant/" + DEVICE_TYPE + "/" + UNIQUE_ID + "/colortemp"
-
-MQTT_RGB_TOPIC = "homeassistant/" + DEVICE_TYPE + "/" + UNIQUE_ID + "/rgb"
-MQTT_RGB_STATE_TOPIC = "homeassistant/" + DEVICE_TYPE + "/" + UNIQUE_ID + "/rgbstatus"
+# Groups the light and the charger sensors into one device in Home Assistant
+device_info = {
+    "identifiers": [UNIQUE_ID],
+    "name": DEVICE_NAME,
+}
 
-MQTT_EFFECT_TOPIC = "homeassistant/" + DEVICE_TYPE + "/" + UNIQUE_ID + "/effect"
-MQTT_EFFECT_STATE_TOPIC = "homeassistant/" + DEVICE_TYPE + "/" + UNIQUE_ID + "/effectstatus"
+charger_properties = {
+    "name": DEVICE_NAME + " Charging",
+    "unique_id": UNIQUE_ID + "_charger",
+    "device_class": "battery_charging",
+    "state_topic": MQTT_CHARGER_STATE_TOPIC,
+    "availability_topic": MQTT_AVAILABILITY_TOPIC,
+    "device": device_info,
+}
 
-# Device properties
-device_properties = {
-    "name": DEVICE_NAME,
-    "unique_id": UNIQUE_ID,
-    "state_topic": MQTT_STATE_TOPIC,
-    "command_topic": MQTT_SET_TOPIC,
-    "brightness_command_topic": MQTT_BRIGHTNESS_TOPIC,
-    "brightness_state_topic": MQTT_BRIGHTNESS_STATE_TOPIC,
-    "brightness_scale": 100,
-    "color_temp_command_topic": MQTT_COLORTEMP_TOPIC,
-    "rgb_command_topic": MQTT_RGB_TOPIC,
-    "rgb_state_topic": MQTT_RGB_STATE_TOPIC,
-    "effect_command_topic": MQTT_EFFECT_TOPIC,
-    "effect_state_topic": MQTT_EFFECT_STATE_TOPIC,
-    "effect_list": ["static", "breathing", "flashing", "fading", "colorloop", "rainbow", "watercolor", "random_flash", "random_breath", "random_fade"],
+charge_session_properties = {
+    "name": DEVICE_NAME + " Charge Session",
+    "unique_id": UNIQUE_ID + "_charge_session",
+    "device_class": "duration",
+    "unit_of_measurement": "s",
+    "state_topic": MQTT_CHARGE_SESSION_STATE_TOPIC,
+    "json_attributes_topic": MQTT_CHARGE_SESSION_ATTRIBUTES_TOPIC, # sessions since boot, start of the running one
+    "availability_topic": MQTT_AVAILABILITY_TOPIC,
+    "device": device_info,
 }
 
-# Convert to JSON
-device_json = ujson.dumps(device_properties)
+# Shared no-op used for every draw call while there is no display
+def no_op(*args, **kwargs):
+    pass
 
-# Create a dummy display class dynamically
+# Stand-in display while the SSD1306 starts up, and for headless (LED only) stands
 class DummyDisplay:
+    async def show_async(self):
+        pass
+
     def __getattr__(self, name):
-        # Return a no-op function for any method called
-        def no_op(*args, **kwargs):
-            pass
+        # Bind the no-op once, later calls find the instance attribute without coming back here
+        setattr(self, name, no_op)
         return no_op
 
-# Initialize SSD1306
-try:
-    i2c = SoftI2C(sda=Pin(1), scl=Pin(0))
-    display = ssd1306.SSD1306_I2C(128, 64, i2c)
-except OSError:
-    display = DummyDisplay()
-    print("Unable to connect to i2C Display")
+headless = False # set when no display is found, the clock face task is then never started
+
+# SSD1306 is initialized by init_display() once the LEDs are running
+display = DummyDisplay()
 
 # Define the pin and number of NeoPixels
 neopixel_pin = Pin(12)
 neopixel_num = 30
 np = NeoPixel(neopixel_pin, neopixel_num)
 
-# Define wirelss charger signal pin
+# Define wirelss charger signal pin, edges are picked up by charger_irq() instead of polling
 charger_signal = Pin(3, Pin.IN)
-charger_last=None
+CHARGER_DEBOUNCE_MS = 50 # the level has to hold this long before a change counts
+charger_state = charger_signal.value() # debounced level, 1 while charging
+charger_flag = asyncio.ThreadSafeFlag() # set on raw edges, charger_monitor() debounces them
+charger_edge_at = time.ticks_ms() # ticks of the latest raw edge
+
+# Charge sessions since boot
+charger_sessions = 1 if charger_state else 0
+charger_session_ticks = time.ticks_ms() # ticks when the current session began
+rtc_synced = False # set by sync_ntp(), the RTC starts at 2000-01-01 on a cold boot
+charger_last_duration = None # seconds, length of the last finished session
 
 rtc = RTC()
 wifi = network.WLAN(network.STA_IF)
 
-# Global variables for neopixel
+# boot.py normally creates wifi_manager and starts associating, fall back when main.py runs on its own
 try:
-    neopixel_mode = devices_config["mode"]
-except KeyError:
-    neopixel_mode = "rainbow"
-    devices_config["mode"] = neopixel_mode
+    wifi_manager
+except NameError:
+    wifi_manager = WiFiManager(wifi, config["wifi_ssid"], config["wifi_password"], static_ip=config.get("wifi_static_ip"))
+    wifi_manager.start()
+
+MQTT_RETRY_MS = 5000 # delay between broker connection attempts
+MQTT_CONNECT_TIMEOUT = 2 # seconds for the TCP connect, and again for the CONNECT / CONNACK exchange
+MQTT_KEEPALIVE = 60 # seconds, the broker drops a silent stand after 1.5x this and publishes its last will
+
+EFFECT_LIST = ["static", "breathing", "flashing", "fading", "colorloop", "rainbow", "watercolor", "random_flash", "random_breath", "random_fade"]
+
+# One Home Assistant light on a range of the strip, with its own topics, state and running effect
+class Segment:
+    def __init__(self, index, seg_config, unique_id):
+        self.index = index
+        self.config = seg_config
+        self.name = seg_config["name"]
+        self.unique_id = unique_id
+        pixels = seg_config.get("pixels", (0, neopixel_num))
+        self.start = min(max(pixels[0], 0), neopixel_num)
+        self.end = min(max(pixels[1], self.start), neopixel_num)
+        self.count = self.end - self.start
+
+        # Defaults from config.json, written back so the file shows every setting
+        self.mode = seg_config.setdefault("mode", "rainbow")
+        self.brightness = seg_config.setdefault("brightness", 1.0)
+        self.rgb = seg_config.setdefault("rgb", "255,255,255")
+        self.transition = seg_config.setdefault("transition", 0) # milliseconds, 0 applies changes instantly
+        self.last_brightness = None
+
+        # Effect parameters, config.json only holds the values that differ from the effects' defaults
+        self.param_overrides = seg_config.get("effect_params", {}) # effect name -> {param: value}
+        self.params = {} # effect name -> merged parameters, filled on first use
+        self.params_version = 0 # bumped on every parameter change
+        self.params_saved = True
+        self.params_payload = None # JSON of the current effect's parameters for the state topic
+
+        # Replay the last light state from the journal, config.json only holds the defaults
+        self.journal = StateJournal(EFFECT_LIST, "state.bin" if index == 0 else "state%d.bin" % index)
+        try:
+            journal_state = self.journal.load()
+        except Exception:
+            journal_state = None
+            print("Unable to read the state journal, using config.json defaults")
+        if journal_state is not None:
+            self.brightness, journal_mode, self.rgb = journal_state
+            if journal_mode is not None:
+                self.mode = journal_mode
+        self.journaled = (self.brightness, self.mode, self.rgb)
+
+        # Values actually rendered by the effects, they follow brightness / rgb over transition ms
+        self.current_brightness = self.brightness
+        self.current_rgb = tuple(int(value) for value in self.rgb.split(","))
+        self.transition_from = None # (brightness, rgb) at the start of the running transition
+        self.transition_to = None
+        self.transition_start = 0
+        self.transition_duration = 0
+
+        # Renderer state
+        self.np = np # effects draw straight into the shared buffer
+        self.effect_def = None # effects.Effect of the current mode
+        self.effect = None # generator of the running effect, yields the ms until its next frame
+        self.effect_mode = None
+        self.tables = None # lookup tables from the effect's prepare(), see effects.py
+        self.tables_effect = None
+        self.tables_version = -1
+        self.off = False
+        self.next_at = time.ticks_ms()
+
+        # Define MQTT Topic Path
+        base = "homeassistant/" + seg_config.get("type", DEVICE_TYPE) + "/" + unique_id
+        self.config_topic = base + "/config"
+        self.state_topic = base + "/status"
+        self.set_topic = base + "/set"
+        self.brightness_topic = base + "/brightness"
+        self.brightness_state_topic = base + "/brightnessstatus"
+        self.colortemp_topic = base + "/colortemp"
+        self.rgb_topic = base + "/rgb"
+        self.rgb_state_topic = base + "/rgbstatus"
+        self.effect_topic = base + "/effect"
+        self.effect_state_topic = base + "/effectstatus"
+        self.transition_topic = base + "/transition"
+        self.effect_params_topic = base + "/effectparams"
+        self.effect_params_state_topic = base + "/effectparamsstatus"
+
+        # Device properties
+        self.properties = {
+            "name": self.name,
+            "unique_id": unique_id,
+            "availability_topic": MQTT_AVAILABILITY_TOPIC,
+            "payload_available": "online",
+            "payload_not_available": "offline",
+            "state_topic": self.state_topic,
+            "command_topic": self.set_topic,
+            "brightness_command_topic": self.brightness_topic,
+            "brightness_state_topic": self.brightness_state_topic,
+            "brightness_scale": 100,
+            "color_temp_command_topic": self.colortemp_topic,
+            "rgb_command_topic": self.rgb_topic,
+            "rgb_state_topic": self.rgb_state_topic,
+            "effect_command_topic": self.effect_topic,
+            "effect_state_topic": self.effect_state_topic,
+            "effect_list": EFFECT_LIST,
+            "device": device_info,
+        }
+
+    def fill(self, color):
+        for i in range(self.start, self.end):
+            np[i] = color
+
+    def begin_transition(self):
+        target_rgb = tuple(int(value) for value in self.rgb.split(","))
+        if self.transition <= 0:
+            # No transition, jump straight to the new state
+            self.current_brightness = self.brightness
+            self.current_rgb = target_rgb
+            self.transition_from = None
+            return
+        self.transition_from = (self.current_brightness, self.current_rgb)
+        self.transition_to = (self.brightness, target_rgb)
+        self.transition_start = time.ticks_ms()
+        self.transition_duration = self.transition
+
+    def transition_step(self):
+        # Called once per frame to advance a running transition
+        if self.transition_from is None:
+            return
+        ratio = time.ticks_diff(time.ticks_ms(), self.transition_start) / self.transition_duration
+        if ratio >= 1.0:
+            self.current_brightness, self.current_rgb = self.transition_to
+            self.transition_from = None
+            return
+        self.current_brightness = self.transition_from[0] + ratio * (self.transition_to[0] - self.transition_from[0])
+        self.current_rgb = interpolate_color(self.transition_from[1], self.transition_to[1], ratio)
+
+    def render(self):
+        # Draw the next frame of this segment into np, returns the ms until the following one
+        self.transition_step()
+        if self.brightness <= 0.0 and self.transition_from is None:
+            # Lights off once any fade out has finished (turn off the rgb light)
+            if not self.off:
+                self.off = True
+                self.effect = None
+                self.effect_mode = None # relabel when the light comes back on
+                self.fill((0, 0, 0))
+                if self.index == 0:
+                    show_mode_label('Light Off')
+            return FRAME_IDLE_MS
+        self.off = False
+        if self.effect_mode != self.mode:
+            # O(1) lookup, modules of lazily registered effects are imported here on first use
+            self.effect_mode = self.mode
+            self.effect_def = effects.get(self.mode) or effects.UNKNOWN
+            self.effect = None
+            self.params_payload = None
+            if self.index == 0:
+                show_mode_label(self.effect_def.label)
+        started = self.effect is None
+        try:
+            if started:
+                effect = self.effect_def
+                params = self.params_for(effect)
+                if effect.prepare is not None and (self.tables_effect is not effect or self.tables_version != self.params_version):
+                    self.tables = None # let the old tables go before the new ones are built
+                    self.tables_effect = None
+                    self.tables = effect.prepare(self, params)
+                    self.tables_effect = effect
+                    self.tables_version = self.params_version
+                self.effect = effect.render(self, params)
+            return next(self.effect)
+        except StopIteration:
+            self.effect = None # start the next cycle on the following frame
+            # a cycle without a single frame would restart at once, forever
+            return FRAME_IDLE_MS if started else 0
+        except Exception as e:
+            # e.g. MemoryError building tables, keep the renderer alive and leave the pixels as they are
+            print("Effect", self.effect_def.name, "failed:", e)
+            self.effect_def = effects.UNKNOWN
+            self.effect = None
+            self.tables = None
+            self.tables_effect = None
+            if self.index == 0:
+                show_mode_label(self.effect_def.label)
+            return FRAME_IDLE_MS
+
+    def params_for(self, effect):
+        params = self.params.get(effect.name)
+        if params is None:
+            params = dict(effect.params)
+            for key, value in self.param_overrides.get(effect.name, {}).items():
+                if effect.accepts(key, value): # config.json may have been edited by hand
+                    params[key] = value
+            self.params[effect.name] = params
+        return params
+
+    def set_params(self, name, values):
+        effect = effects.get(name)
+        if effect is None:
+            print("Unknown effect", name)
+            return
+        params = self.params_for(effect)
+        changed = False
+        for key, value in values.items():
+            if not effect.accepts(key, value):
+                print("Ignoring", name, "parameter", key, value)
+                continue
+            if params[key] != value:
+                params[key] = value
+                changed = True
+        if not changed:
+            return
+        print("Set", self.name, name, "parameters to", params)
+        overrides = {}
+        for key, value in params.items():
+            if value != effect.params[key]:
+                overrides[key] = value
+        self.param_overrides[name] = overrides
+        self.config["effect_params"] = self.param_overrides
+        self.params_saved = False
+        self.params_version += 1
+        self.params_payload = None
+        if name == self.effect_mode:
+            # look the effect up again and restart it with the new parameters and tables,
+            # it may have been replaced by effects.UNKNOWN after failing with the old ones
+            self.effect_mode = None
+            self.next_at = time.ticks_ms()
+        mark_config_changed()
+
+    def command(self, kind, payload):
+        if kind == "set" and payload == "ON":
+            if self.brightness <= 0.0:
+                if self.last_brightness is None or self.last_brightness <= 0.0:
+                    self.brightness = 1.0
+                else:
+                    self.brightness = self.last_brightness
+                print(self.name, "ON")
+        elif kind == "set" and payload == "OFF":
+            print(self.name, "OFF")
+            self.last_brightness = self.brightness
+            self.brightness = 0.0
+        elif kind == "brightness":
+            self.brightness = int(payload) / 100.0
+            print("Adjust", self.name, "brightness to", self.brightness * 100)
+        elif kind == "effect":
+            self.mode = payload
+            print("Change", self.name, "mode to", self.mode)
+        elif kind == "rgb":
+            if self.mode == "rainbow" or self.mode == "watercolor":
+                self.mode = "static"
+            self.rgb = payload
+            print("Set", self.name, "color to", self.rgb)
+        elif kind == "colortemp":
+            if self.mode == "rainbow" or self.mode == "watercolor":
+                self.mode = "static"
+            print("Set", self.name, "temperature to", payload)
+            self.rgb = temp_to_rgb(int(payload))
+        elif kind == "params":
+            # {"wait": 20} for the current effect, or {"effect": "rainbow", "wait": 20}
+            try:
+                values = ujson.loads(payload)
+                name = values.pop("effect", self.mode)
+            except (ValueError, AttributeError, TypeError):
+                print("Invalid effect parameters", payload)
+                return
+            if not isinstance(name, str):
+                print("Invalid effect name", name) # effects.get() needs a hashable key
+                return
+            self.set_params(name, values)
+            return
+        elif kind == "transition":
+            self.transition = max(0, int(payload))
+            print("Set", self.name, "transition to", self.transition, "ms")
+            mark_config_changed()
+            return
+        else:
+            return
+        # Fade from the rendered state to the new target, starting with the next frame
+        self.begin_transition()
+        self.next_at = time.ticks_ms()
+        mark_config_changed()
 
-try:
-    neopixel_brightness = devices_config["brightness"]
-except KeyError:
-    neopixel_brightness = 1.0
-    devices_config["brightness"] = neopixel_brightness
+    def publish_state(self):
+        # ON / OFF State
+        if self.brightness <= 0.0:
+            mqtt_publish((self.state_topic).encode(), b"OFF", retain=True)
+            return
+        mqtt_publish((self.state_topic).encode(), b"ON", retain=True)
+
+        # Brightness State
+        scaled_brightness = int(self.brightness*100)
+        mqtt_publish((self.brightness_state_topic).encode(), (str(scaled_brightness)).encode(), retain=True)
+
+        # RGB State
+        if self.mode != "rainbow" and self.mode != "watercolor":
+            mqtt_publish((self.rgb_state_topic).encode(), (self.rgb).encode(), retain=True)
+
+        # NeoPixel Mode State
+        mqtt_publish((self.effect_state_topic).encode(), (self.mode).encode(), retain=True)
+
+        # Effect parameters, serialized again only after a mode or parameter change
+        if self.effect_def is not None:
+            if self.params_payload is None:
+                self.params_payload = ujson.dumps(self.params_for(self.effect_def)).encode()
+            mqtt_publish((self.effect_params_state_topic).encode(), self.params_payload, retain=True)
+
+# The first segment keeps the ID of the single light, so switching to segments keeps its Home Assistant entity.
+# Segments without pixels on the strip are left out, their effects would never draw a frame
+segments = []
+for i, seg_config in enumerate(segments_config):
+    seg = Segment(i, seg_config, UNIQUE_ID if i == 0 else UNIQUE_ID + "_" + str(i))
+    if seg.count == 0:
+        print("Segment", seg.name, "has no pixels on the strip, skipped")
+        continue
+    segments.append(seg)
+
+# Discovery configs published on every (re)connect
+MQTT_DISCOVERY = [(seg.config_topic, seg.properties) for seg in segments] + [
+    (MQTT_CHARGER_CONFIG_TOPIC, charger_properties),
+    (MQTT_CHARGE_SESSION_CONFIG_TOPIC, charge_session_properties),
+]
+
+# Topics the stand listens on, and the segment and command each one maps to
+MQTT_SUBSCRIPTIONS = []
+mqtt_commands = {}
+for seg in segments:
+    MQTT_SUBSCRIPTIONS += [
+        # basic control
+        seg.config_topic, seg.state_topic, seg.set_topic,
+        # color temp and brightness light control
+        seg.brightness_topic, seg.brightness_state_topic, seg.colortemp_topic,
+        # rgb and effect light control
+        seg.rgb_topic, seg.rgb_state_topic, seg.effect_topic, seg.effect_state_topic,
+        seg.transition_topic, seg.effect_params_topic,
+    ]
+    for kind, topic in (("set", seg.set_topic), ("brightness", seg.brightness_topic), ("colortemp", seg.colortemp_topic),
+                        ("rgb", seg.rgb_topic), ("effect", seg.effect_topic), ("transition", seg.transition_topic),
+                        ("params", seg.effect_params_topic)):
+        mqtt_commands[topic.encode()] = (seg, kind)
 
-try:
-    neopixel_rgb = devices_config["rgb"]
-except KeyError:
-    neopixel_rgb = "255,255,255"
-    devices_config["rgb"] = neopixel_rgb
+# Set whenever a persisted value changes, save_config() waits on it
+config_dirty = asyncio.Event()
+config_changed_at = 0
 
-neopixel_speed=10
-last_neopixel=None
-last_brightness=None
+def mark_config_changed():
+    global config_changed_at
+    config_changed_at = time.ticks_ms()
+    config_dirty.set()
 
 # MQTT callback function
 def mqtt_callback(topic, msg):
-    global neopixel_mode, neopixel_brightness, neopixel_rgb, last_brightness  # Declare multiple global variables in one line
-    current_payload = msg.decode()
-
-    if topic == (MQTT_SET_TOPIC).encode() and current_payload == "ON":
-        if neopixel_brightness <= 0.0:
-            if last_brightness <= 0.0:
-                neopixel_brightness = 100.0
-            else:
-                neopixel_brightness = last_brightness
-            print("Light ON")
-    elif topic == (MQTT_SET_TOPIC).encode() and current_payload == "OFF":
-        print("Light OFF")
-        last_brightness = neopixel_brightness
-        neopixel_brightness = 0.0
-    elif topic == (MQTT_BRIGHTNESS_TOPIC).encode():
-        neopixel_brightness = int(current_payload) / 100.0
-        print("Adjust brightness to", neopixel_brightness * 100)
-    elif topic == (MQTT_EFFECT_TOPIC).encode():
-        neopixel_mode = current_payload
-        print("Change Neopixel Mode to", neopixel_mode)
-    elif topic == (MQTT_RGB_TOPIC).encode():
-        if neopixel_mode == "rainbow" or neopixel_mode == "watercolor":
-            neopixel_mode = "static"
-        neopixel_rgb = current_payload
-        print("Set Color to", neopixel_rgb)
-    elif topic == (MQTT_COLORTEMP_TOPIC).encode():
-        if neopixel_mode == "rainbow" or neopixel_mode == "watercolor":
-            neopixel_mode = "static"
-        print("Set Temperature to", current_payload)
-        neopixel_rgb = temp_to_rgb(int(current_payload))
-    elif topic != (MQTT_CONFIG_TOPIC).encode() and "status" not in topic.decode():
-        print("Received unprocessed message on topic:", topic.decode())
-        print("Message:", current_payload)
-            
-mqtt_client = MQTTClient(UNIQUE_ID, MQTT_BROKER, MQTT_PORT, MQTT_USER, MQTT_PASSWORD)
-mqtt_client.set_callback(mqtt_callback)
+    command = mqtt_commands.get(topic)
+    if command is None:
+        if not topic.endswith(b"/config") and b"status" not in topic:
+            print("Received unprocessed message on topic:", topic.decode())
+            print("Message:", msg.decode())
+        return
+    seg, kind = command
+    seg.command(kind, msg.decode())
+
+# Created by mqtt_connect() on the first connection attempt
+mqtt_client = None
+mqtt_connected = False
+
+# Outbound MQTT queue (ring buffer), used while the broker is unreachable
+# Only the latest value per topic is kept, so a reconnect flushes at most one message per topic
+MQTT_QUEUE_SIZE = 16
+mqtt_queue = [None] * MQTT_QUEUE_SIZE  # slots of [topic, msg, retain]
+mqtt_queue_slots = {}  # topic -> slot index in mqtt_queue
+mqtt_queue_head = 0
+mqtt_queue_len = 0
+mqtt_last_sent = {}  # topic -> last payload delivered to the broker
+
+def mqtt_enqueue(topic, msg, retain=False):
+    global mqtt_queue_head, mqtt_queue_len
+    slot = mqtt_queue_slots.get(topic)
+    if slot is not None:
+        # Coalesce, replace the pending value for this topic
+        mqtt_queue[slot][1] = msg
+        mqtt_queue[slot][2] = retain
+        return
+    if mqtt_queue_len == MQTT_QUEUE_SIZE:
+        # Queue is full, drop the oldest entry
+        del mqtt_queue_slots[mqtt_queue[mqtt_queue_head][0]]
+        mqtt_queue[mqtt_queue_head] = None
+        mqtt_queue_head = (mqtt_queue_head + 1) % MQTT_QUEUE_SIZE
+        mqtt_queue_len -= 1
+    slot = (mqtt_queue_head + mqtt_queue_len) % MQTT_QUEUE_SIZE
+    mqtt_queue[slot] = [topic, msg, retain]
+    mqtt_queue_slots[topic] = slot
+    mqtt_queue_len += 1
+
+def mqtt_flush_queue():
+    global mqtt_queue_head, mqtt_queue_len, mqtt_connected
+    while mqtt_queue_len > 0:
+        topic, msg, retain = mqtt_queue[mqtt_queue_head]
+        try:
+            mqtt_client.publish(topic, msg, retain=retain)
+        except OSError:
+            mqtt_connected = False
+            return # keep the remaining entries for the next reconnect
+        mqtt_last_sent[topic] = msg
+        del mqtt_queue_slots[topic]
+        mqtt_queue[mqtt_queue_head] = None
+        mqtt_queue_head = (mqtt_queue_head + 1) % MQTT_QUEUE_SIZE
+        mqtt_queue_len -= 1
+
+def mqtt_publish(topic, msg, retain=False):
+    global mqtt_connected
+    # Skip payloads the broker already has
+    if mqtt_last_sent.get(topic) == msg and topic not in mqtt_queue_slots:
+        return
+    if mqtt_connected:
+        try:
+            mqtt_client.publish(topic, msg, retain=retain)
+            mqtt_last_sent[topic] = msg
+            return
+        except OSError:
+            mqtt_connected = False
+    mqtt_enqueue(topic, msg, retain)
+
+# CONNECT packet with the client's settings, the same bytes umqtt.simple's connect() sends
+def mqtt_connect_packet(client):
+    def field(value):
+        if isinstance(value, str):
+            value = value.encode()
+        return len(value).to_bytes(2, "big") + value
+
+    flags = 0x02 # clean session
+    payload = field(client.client_id)
+    if client.lw_topic:
+        flags |= 0x04 | (client.lw_qos & 0x3) << 3 | client.lw_retain << 5
+        payload += field(client.lw_topic) + field(client.lw_msg)
+    if client.user:
+        flags |= 0xC0
+        payload += field(client.user) + field(client.pswd)
+    body = b"\x00\x04MQTT\x04" + bytes((flags,)) + client.keepalive.to_bytes(2, "big") + payload
+    size = len(body)
+    header = bytearray(b"\x10")
+    while size > 0x7F:
+        header.append((size & 0x7F) | 0x80)
+        size >>= 7
+    header.append(size)
+    return bytes(header) + body
+
+# umqtt.simple's connect() blocks every other task for the TCP handshake and the CONNACK, so the
+# socket is opened and the handshake run through the uasyncio IO queue instead. The client then
+# takes over the connected socket for subscribe(), publish() and check_msg()
+async def mqtt_handshake(reader):
+    from umqtt.simple import MQTTException
+    await reader.awrite(mqtt_connect_packet(mqtt_client))
+    resp = await reader.readexactly(4)
+    if resp[0] != 0x20 or resp[1] != 0x02:
+        raise MQTTException("Unexpected CONNACK")
+    if resp[3] != 0:
+        raise MQTTException(resp[3]) # refused, e.g. 4 or 5 for bad credentials
+
+async def mqtt_connect():
+    global mqtt_client, mqtt_connected
+    if mqtt_client is None:
+        from umqtt.simple import MQTTClient
+        mqtt_client = MQTTClient(UNIQUE_ID, MQTT_BROKER, MQTT_PORT, MQTT_USER, MQTT_PASSWORD, keepalive=MQTT_KEEPALIVE)
+        mqtt_client.set_callback(mqtt_callback)
+        # Broker marks the stand offline for Home Assistant if the connection drops without a clean disconnect
+        mqtt_client.set_last_will((MQTT_AVAILABILITY_TOPIC).encode(), b"offline", retain=True)
+    if mqtt_client.sock is not None:
+        try:
+            mqtt_client.sock.close() # left over from the previous connection
+        except OSError:
+            pass
+        mqtt_client.sock = None
+    # Connect to MQTT broker, the DNS lookup is cached (and only blocks for host names, never for an IP)
+    from async_urequests import open_connection
+    reader, _ = await open_connection(MQTT_BROKER, MQTT_PORT, False, connect_timeout=MQTT_CONNECT_TIMEOUT)
+    try:
+        await asyncio.wait_for(mqtt_handshake(reader), MQTT_CONNECT_TIMEOUT)
+    except BaseException:
+        reader.s.close()
+        raise
+    reader.s.setblocking(True) # as umqtt.simple leaves it after connect()
+    mqtt_client.sock = reader.s
+    for topic in MQTT_SUBSCRIPTIONS:
+        mqtt_client.subscribe(topic.encode())
+    # Publish Config for Auto Discovery
+    for topic, properties in MQTT_DISCOVERY:
+        mqtt_client.publish(topic.encode(), ujson.dumps(properties), retain=True)
+    mqtt_client.publish((MQTT_AVAILABILITY_TOPIC).encode(), b"online", retain=True)
+    mqtt_connected = True
+    # The broker may have restarted, so send every state once more
+    mqtt_last_sent.clear()
+    boot_mark("mqtt")
+    # Deliver whatever was queued while offline
+    mqtt_flush_queue()
+    publish_charger()
 
 month_names = {
     1: 'Jan',
@@ -184,45 +662,6 @@ month_names = {
 # Neopixel Functions
 
 # Helper Functions
-def wheel(pos):
-    # Input a value 0 to 255 to get a color value.
-    # The colors are a transition from red to green to blue and back to red.
-    if pos < 85:
-        return (int(pos * 3), int(255 - pos * 3), 0)
-    elif pos < 170:
-        pos -= 85
-        return (int(255 - pos * 3), 0, int(pos * 3))
-    else:
-        pos -= 170
-        return (0, int(pos * 3), int(255 - pos * 3))
-
-def scale_brightness(color, brightness):
-    return (
-        int(color[0] * brightness),
-        int(color[1] * brightness),
-        int(color[2] * brightness)
-    )
-
-def interpolate_color(color1, color2, ratio):
-    # Interpolate between two colors based on the given ratio
-    return (
-        int(color1[0] + ratio * (color2[0] - color1[0])),
-        int(color1[1] + ratio * (color2[1] - color1[1])),
-        int(color1[2] + ratio * (color2[2] - color1[2]))
-    )
-
-def repeat_colors(colors, factor):
-    repeated_colors = []
-    
-    for color in colors:
-        for _ in range(factor):
-            repeated_colors.append(color)
-    
-    return repeated_colors
-
-def random_color():
-    return (urandom.randint(0, 255), urandom.randint(0, 255), urandom.randint(0, 255))
-
 def temp_to_rgb(color_temp, returnString=True):
     #Convert color temperature to RGB.
     #param color_temp: Color temperature in Kelvin or Mireds
@@ -269,117 +708,32 @@ def temp_to_rgb(color_temp, returnString=True):
     else:
         return rgb_values
 
-# Color Effects
-
-def static_color(color):
-    np.fill(scale_brightness(color, neopixel_brightness))
-    np.write()
-
-async def color_breathing(duration, steps=100):
-    for step in range(steps):
-        brightness_value = int(neopixel_brightness * 0.5 * (1 + math.sin(2 * math.pi * step / steps)) * 255)
-        color_values = [int(value) for value in neopixel_rgb.split(",")]
-        np.fill(scale_brightness(color_values, brightness_value / 255))
-        np.write()
-        # Break the function for real time neopixel mode switch
-        if last_neopixel != neopixel_mode:
-            break  # Break out of the inner loop   
-        await asyncio.sleep_ms(duration // steps)
-
-async def color_flash(num_flashes, flash_duration, delay):
-    for _ in range(num_flashes):
-        color_values = [int(value) for value in neopixel_rgb.split(",")]
-        np.fill(scale_brightness(color_values, neopixel_brightness))
-        np.write()
-        # Break the function for real time neopixel mode switch
-        if last_neopixel != neopixel_mode:
-            break  # Break out of the inner loop   
-        await asyncio.sleep_ms(flash_duration)
-        np.fill((0, 0, 0))  # Turn off the lights
-        np.write()
-        # Break the function for real time neopixel mode switch
-        if last_neopixel != neopixel_mode:
-            break  # Break out of the inner loop   
-        await asyncio.sleep_ms(delay)
-
-async def random_flash(num_flashes, flash_duration, delay):
-    for _ in range(num_flashes):
-        np.fill(scale_brightness(random_color(), neopixel_brightness))
-        np.write()
-        # Break the function for real time neopixel mode switch
-        if last_neopixel != neopixel_mode:
-            break  # Break out of the inner loop   
-        await asyncio.sleep_ms(flash_duration)
-        np.fill((0, 0, 0))  # Turn off the lights
-        np.write()
-        # Break the function for real time neopixel mode switch
-        if last_neopixel != neopixel_mode:
-            break  # Break out of the inner loop   
-        await asyncio.sleep_ms(delay)
-
-async def rainbow_cycle(wait):
-    flag_break = False  # Flag to indicate if we should break out of loops
-    for j in range(255):
-        for i in range(neopixel_num):
-            pixel_index = (i * 256 // neopixel_num) + j
-            np[i] = scale_brightness(wheel(pixel_index & 255), neopixel_brightness)
-            # Break the function for real time neopixel mode switch
-            if last_neopixel != neopixel_mode:
-                flag_break = True  # Set the flag to break out of loops
-                break  # Break out of the inner loop                
-        np.write()
-        if flag_break:
-            break  # Break out of the outer loop
-        await asyncio.sleep_ms(wait)
-
-async def watercolor_rainbow_cycle(wait):
-    # Define a list of the Watercolors (CMYK)
-    colors = [
-        (255, 255, 255),
-        (0, 255, 255),
-        (255, 255, 255),
-        (255, 0, 255),
-        (255, 255, 255),
-        (255, 255, 0),
-    ]
-
-    flag_break = False  # Flag to indicate if we should break out of loops
-    colors = repeat_colors(colors, 6)
-    num_colors = len(colors)
-
-    for j in range(-neopixel_num * 2, neopixel_num * 2):
-        for i in range(neopixel_num):
-            color_index = (i + j) % (num_colors * 2)
+# Label of the first segment's effect, redrawn by the clock face once the display is up
+mode_label = None
 
-            if color_index >= num_colors:
-                color_index = (num_colors - 1) - (color_index - num_colors)
+def show_mode_label(label):
+    global mode_label
+    mode_label = label
+    draw_mode_label()
 
-            # Calculate a smooth transition between colors
-            ratio = abs(j) / (neopixel_num * 2)
-
-            # Interpolate between consecutive colors
-            interpolated_color = interpolate_color(colors[color_index], colors[(color_index + 1) % num_colors], ratio)
-
-            # Scale the brightness of the interpolated color
-            interpolated_color = scale_brightness(interpolated_color, neopixel_brightness)
-
-            np[i] = interpolated_color
-
-            # Break the function for real time neopixel mode switch
-            if last_neopixel != neopixel_mode:
-                flag_break = True  # Set the flag to break out of loops
-                break  # Break out of the inner loop   
-
-        np.write()
-        if flag_break:
-            break  # Break out of the outer loop
-        await asyncio.sleep_ms(wait * 10)
+def draw_mode_label():
+    # Clear the previous text on the display
+    display.fill_rect(effects.LABEL_LEFT, 0, effects.LABEL_WIDTH, 8, 0)
+    if mode_label is not None:
+        # centered in the label area
+        display.text(mode_label, effects.LABEL_LEFT + (effects.LABEL_WIDTH - len(mode_label) * 8) // 2, 0, 1)
 
 # Sync Network Clock
 async def get_world_time():
+    global requests, http_session
     try:
-        response = await requests.get("http://worldtimeapi.org/api/ip")
-        data = response.json()
+        if requests is None:
+            import async_urequests as requests
+            http_session = requests.Session() # keep the connection to the time API open between polls
+            boot_mark("http client")
+        # tight per-phase deadlines so a slow server cannot hold up the clock
+        response = await http_session.get("http://worldtimeapi.org/api/ip", stream=True, timeout=5, connect_timeout=2, read_timeout=3)
+        data = await response.json_fields("datetime") # only keep the one field we need
         return data["datetime"]
     except Exception as e:
         print("Error fetching time:", e)
@@ -396,21 +750,148 @@ def parse_datetime(datetime_str):
 
     return (year, month, day, hour, minute, second, 0, 0)
     
-# Initial Splash Screen
-display.fill(1)
-display.fill_rect(4, 4, 32, 32, 0)
-display.fill_rect(4, 8, 24, 16, 1)
-display.text('1us', 4, 12, 0)
-display.text('Power Stand', 38, 4, 0)
-display.text('ESP32-C3', 38, 16, 0)
-display.text('v0.1.1', 38, 28, 0)
-display.text('STARTING ...', 16, 40, 0)
-display.show()
-display.fill(0)
-    
+# Display bus settings, all optional in config.json "display"
+try:
+    display_config = config["display"]
+except KeyError:
+    display_config = {}
+DISPLAY_SDA = display_config.get("sda", 1)
+DISPLAY_SCL = display_config.get("scl", 0)
+DISPLAY_ADDR = display_config.get("addr", 0x3C)
+DISPLAY_I2C_ID = display_config.get("i2c_id", 0)
+DISPLAY_FREQ = display_config.get("freq") # None probes 1 MHz, 400 kHz and 100 kHz
+
+def panel_responds(i2c):
+    # The panel must ACK its address and a command byte (0xE3 is a NOP)
+    try:
+        i2c.writeto(DISPLAY_ADDR, b"\x80\xe3")
+        return True
+    except OSError:
+        return False
+
+def open_display_bus():
+    # Prefer the hardware I2C peripheral at the fastest frequency the panel accepts, fall back to SoftI2C
+    freqs = (DISPLAY_FREQ,) if DISPLAY_FREQ else (1000000, 400000, 100000)
+    for freq in freqs:
+        try:
+            i2c = I2C(DISPLAY_I2C_ID, sda=Pin(DISPLAY_SDA), scl=Pin(DISPLAY_SCL), freq=freq)
+        except (OSError, ValueError):
+            break # no hardware I2C on these pins
+        if panel_responds(i2c):
+            print("Display on hardware I2C at", freq, "Hz")
+            return i2c
+    for freq in freqs:
+        i2c = SoftI2C(sda=Pin(DISPLAY_SDA), scl=Pin(DISPLAY_SCL), freq=freq)
+        if panel_responds(i2c):
+            print("Display on SoftI2C at", freq, "Hz")
+            return i2c
+    return None
+
+# Initialize SSD1306 and show the splash screen, runs after the LEDs are lit
+async def init_display():
+    global display, headless
+    await asyncio.sleep_ms(0)
+    import ssd1306
+    try:
+        i2c = open_display_bus()
+        if i2c is None:
+            raise OSError("no display")
+        oled = ssd1306.SSD1306_I2C(128, 64, i2c, addr=DISPLAY_ADDR)
+    except OSError:
+        print("Unable to connect to i2C Display, running headless")
+        headless = True
+        return
+
+    # Initial Splash Screen
+    oled.fill(1)
+    oled.fill_rect(4, 4, 32, 32, 0)
+    oled.fill_rect(4, 8, 24, 16, 1)
+    oled.text('1us', 4, 12, 0)
+    oled.text('Power Stand', 38, 4, 0)
+    oled.text('ESP32-C3', 38, 16, 0)
+    oled.text('v0.1.1', 38, 28, 0)
+    oled.text('STARTING ...', 16, 40, 0)
+    oled.show()
+    try:
+        oled.load_font()
+    except OSError:
+        print("font.bin not found, drawing the clock with the vector font")
+    oled.fill(0)
+    display = oled
+    boot_mark("display")
+    # The clock face only runs when there is a display to draw it on
+    asyncio.create_task(main())
+
+# Lightning bolt while charging, three bars otherwise
+def draw_charger():
+    display.fill_rect(105, 2, 15, 47, 0) # Clear the right patterns
+    if charger_state:
+        display.line(112, 8, 105, 28, 1)
+        display.line(105, 28, 119, 28, 1)
+        display.line(119, 28, 112, 48, 1)
+    else:
+        display.vline(105, 8, 40, 1)
+        display.vline(112, 2, 40, 1)
+        display.vline(119, 8, 40, 1)
+
+# Charger entities only change on an edge, mqtt_publish() drops repeats
+def publish_charger():
+    mqtt_publish((MQTT_CHARGER_STATE_TOPIC).encode(), b"ON" if charger_state else b"OFF", retain=True)
+    if charger_last_duration is not None:
+        mqtt_publish((MQTT_CHARGE_SESSION_STATE_TOPIC).encode(), (str(charger_last_duration)).encode(), retain=True)
+    # The session start is kept in ticks, it only becomes a time once NTP has set the RTC (to UTC)
+    session_start = None
+    if charger_state and rtc_synced:
+        start = time.time() - time.ticks_diff(time.ticks_ms(), charger_session_ticks) // 1000
+        session_start = "{:04d}-{:02d}-{:02d}T{:02d}:{:02d}:{:02d}+00:00".format(*time.gmtime(start)[:6])
+    attributes = {"sessions": charger_sessions, "session_start": session_start}
+    mqtt_publish((MQTT_CHARGE_SESSION_ATTRIBUTES_TOPIC).encode(), (ujson.dumps(attributes)).encode(), retain=True)
+
+# Runs through micropython.schedule, outside of the interrupt
+def charger_edge(_):
+    global charger_edge_at
+    charger_edge_at = time.ticks_ms()
+    charger_flag.set()
+
+def charger_irq(pin):
+    try:
+        micropython.schedule(charger_edge, None)
+    except RuntimeError:
+        pass # schedule queue full, an edge is already pending
+
+charger_signal.irq(charger_irq, Pin.IRQ_RISING | Pin.IRQ_FALLING)
+
+# Sleeps until the charger pin changes, then debounces the edge and updates the session stats
+async def charger_monitor():
+    global charger_state, charger_sessions, charger_session_ticks, charger_last_duration
+    while True:
+        await charger_flag.wait()
+        # every bounce moves charger_edge_at, wait until the pin has been quiet long enough
+        while True:
+            quiet = CHARGER_DEBOUNCE_MS - time.ticks_diff(time.ticks_ms(), charger_edge_at)
+            if quiet <= 0:
+                break
+            await asyncio.sleep_ms(quiet)
+        level = charger_signal.value()
+        if level == charger_state:
+            continue # bounced back
+        charger_state = level
+        if level:
+            charger_sessions += 1
+            charger_session_ticks = time.ticks_ms()
+            print("Charging, session", charger_sessions)
+        else:
+            charger_last_duration = time.ticks_diff(time.ticks_ms(), charger_session_ticks) // 1000
+            print("Not Charging, session lasted", charger_last_duration, "s")
+        publish_charger()
+        if not headless:
+            draw_charger()
+            await display.show_async()
+
 # Main loop
 async def main():
-    global charger_last
+    draw_mode_label()
+    draw_charger()
     while True:
         # Fetch current time and date
         current_time = await get_world_time()
@@ -431,7 +912,6 @@ async def main():
         # Clear the area
         display.fill_rect(28, 12, 72, 24, 0)  # Clear the time area
         display.fill_rect(16, 48, 96, 8, 0)  # Clear the date area
-        display.fill_rect(105, 2, 15, 47, 0) # Clear the right patterns
         
         # Display time and date
         display.overlap_wrap(time_string, 28, 16, 3)
@@ -441,162 +921,117 @@ async def main():
         display.vline(16, 2, 40, 1)
         display.vline(23, 8, 40, 1)
 
-        if charger_signal.value():
-            if charger_last != 1:
-                print("Charging")
-                charger_last=1
-
-            # Lightning bolt symbol
-            display.line(112, 8, 105, 28, 1)
-            display.line(105, 28, 119, 28, 1)
-            display.line(119, 28, 112, 48, 1)
-
-        else:
-            if charger_last == 1:
-                print("Not Charging")
-
-            display.vline(105, 8, 40, 1)
-            display.vline(112, 2, 40, 1)
-            display.vline(119, 8, 40, 1) 
-
-            charger_last=0
-             
-        display.show()
+        # Flush page by page so the neopixel task keeps running during the transfer
+        await display.show_async()
         
         # Allow other tasks to run by yielding control to the event loop
         await asyncio.sleep_ms(0)
 
 # Separate loop for MQTT message checking
 async def mqtt_message_checker():
+    global mqtt_connected
+    last_ping = time.ticks_ms()
     while True:
         try:
-            mqtt_client.check_msg()
+            if mqtt_connected:
+                mqtt_client.check_msg()
+                # Publishing is change-only, ping at half the keepalive so an idle stand stays connected
+                if time.ticks_diff(time.ticks_ms(), last_ping) >= MQTT_KEEPALIVE * 500:
+                    last_ping = time.ticks_ms()
+                    mqtt_client.ping()
+            else:
+                last_ping = time.ticks_ms()
+        except OSError:
+            mqtt_connected = False # reconnected by check_wifi
         except:
             pass # ignore any error so it wont spam the serial when no mqtt or wifi is available
         await asyncio.sleep_ms(0)  # Adjust the sleep time as needed
 
 # Separate loop for MQTT message sending
+# Only changed values are published, and queued while the broker is unreachable
 async def mqtt_message_sender():
     while True:
-
-        # ON / OFF State
-        try:
-            if neopixel_brightness <= 0.0:
-                mqtt_client.publish((MQTT_STATE_TOPIC).encode(), b"OFF")
-            else:
-                mqtt_client.publish((MQTT_STATE_TOPIC).encode(), b"ON")
-        except:
-            pass # ignore any error so it wont spam the serial when no mqtt or wifi is available
-
-        if neopixel_brightness > 0.0:
-            # Brightness State
-            try:
-                    scaled_brightness = int(neopixel_brightness*100)
-                    mqtt_client.publish((MQTT_BRIGHTNESS_STATE_TOPIC).encode(), (str(scaled_brightness)).encode())
-            except:
-                pass # ignore any error so it wont spam the serial when no mqtt or wifi is available
-
-            # RGB State
-            try:
-                if neopixel_mode != "rainbow" and neopixel_mode != "watercolor":
-                    mqtt_client.publish((MQTT_RGB_STATE_TOPIC).encode(), (neopixel_rgb).encode())
-            except:
-                pass # ignore any error so it wont spam the serial when no mqtt or wifi is available
-
-            # NeoPixel Mode State
-            try:
-                mqtt_client.publish((MQTT_EFFECT_STATE_TOPIC).encode(), (neopixel_mode).encode())
-            except:
-                pass # ignore any error so it wont spam the serial when no mqtt or wifi is available
+        for seg in segments:
+            seg.publish_state()
 
         await asyncio.sleep_ms(100)  # Adjust the sleep time as needed
 
 # Neopixel loop
+# Renders every segment that is due into the shared np buffer, then writes the strip once
 async def run_neopixel():
-    global last_neopixel
     while True:
-        # Clear the previous text on the display
-        display.fill_rect(24, 0, 80, 8, 0)
-
-            #elif neopixel_mode == "random":
-            # Random effect (randomly loop among all color effects)
-            #display.text('Random', 40, 0, 1)
-            # Implement random effect (Coming Soon)
-
-        if neopixel_brightness <= 0.0:
-            # Lights off (turn off the rgb light)
-            display.text('Light Off', 30, 0, 1)
-            static_color((0, 0, 0))  # Turn off the RGB light
-        else:
-            if neopixel_mode == "rainbow":
-                # Rainbow wave effect
-                display.text('Rainbow', 36, 0, 1)
-                await rainbow_cycle(10)  # Adjust the value to control the speed of the rainbow wave
-            elif neopixel_mode == "breathing":
-                # Color breathing effect (e.g., breathing white)
-                display.text('Breathing', 30, 0, 1)
-                await color_breathing(2000)  # Adjust the duration as needed
-            elif neopixel_mode == "flashing":
-                # Random color flashes
-                display.text('Flashing', 32, 0, 1)
-                await color_flash(5, 50, 500)  # Adjust the number of flashes, flash duration, and delay as needed
-            elif neopixel_mode == "static":
-                # Static color effect
-                display.text('Static', 40, 0, 1)
-                color_values = [int(value) for value in neopixel_rgb.split(",")]
-                static_color(color_values)
-            elif neopixel_mode == "watercolor":
-                # Watercolor rainbow cycle effect (Experimental, mostly working but not smooth enough like iCUE's)
-                display.text('Watercolor', 26, 0, 1)
-                await watercolor_rainbow_cycle(5)  # Adjust the value to control the speed of the watercolor rainbow cycle
-            elif neopixel_mode == "random_flash":
-                # Random color flashes
-                display.text('R.Flashing', 25, 0, 1)
-                await random_flash(5, 50, 500)  # Adjust the number of flashes, flash duration, and delay as needed
-            else:
-                # Unknown Values
-                display.text('UnknownVal', 25, 0, 1)
-        last_neopixel=neopixel_mode
-        # Allow other tasks to run by yielding control to the event loop
-        await asyncio.sleep(0)
+        now = time.ticks_ms()
+        wait = FRAME_IDLE_MS
+        drawn = False
+        for seg in segments:
+            remaining = time.ticks_diff(seg.next_at, now)
+            if remaining <= 0:
+                remaining = seg.render()
+                seg.next_at = time.ticks_add(now, remaining)
+                drawn = True
+            if remaining < wait:
+                wait = remaining
+        if drawn:
+            np.write()
+            boot_mark("first light") # only the first write is recorded
+        # Allow other tasks to run until the next segment is due
+        await asyncio.sleep_ms(wait)
 
+# Synchronize with NTP server to get current time, scheduled by wifi_manager whenever WiFi comes online
+async def sync_ntp():
+    global rtc_synced
+    try:
+        await ntp_settime()
+    except OSError as e:
+        print("Error syncing NTP:", e)
+        return
+    if not rtc_synced:
+        rtc_synced = True
+        publish_charger() # a running session gets its start time now
+
+# Called on every transition to online
+def wifi_online():
+    # lookups that failed while the link was down would stay cached for DNS_NEGATIVE_TTL,
+    # the HTTP client is loaded by the clock or the MQTT connect, nothing to flush before that
+    http = sys.modules.get("async_urequests")
+    if http is not None:
+        http.dns_flush()
+    asyncio.create_task(sync_ntp())
+
+wifi_manager.on_online = wifi_online
+
+# The connection itself is driven by wifi_manager.run(), this task reflects it on the display
+# and (re)connects the MQTT broker while WiFi is up
 async def check_wifi():
+    global mqtt_connected
     last_state=None
+    last_mqtt_attempt=None
     while True:
-        current_state = wifi.isconnected()
+        current_state = wifi_manager.online
         
         # Clear the previous text on the display
         display.fill_rect(16, 56, 96, 8, 0)
         
         if current_state:
-            if last_state != current_state:
-                print("WiFi Connected")
-                # Synchronize with NTP server to get current time
-                ntptime.settime()
-                # Connect to MQTT broker
-                mqtt_client.connect()
-                # Subscribe to topics for basic control
-                mqtt_client.subscribe((MQTT_CONFIG_TOPIC).encode())
-                mqtt_client.subscribe((MQTT_STATE_TOPIC).encode())
-                mqtt_client.subscribe((MQTT_SET_TOPIC).encode())
-                # Subscribe to topics for color temp and brightness light control
-                mqtt_client.subscribe((MQTT_BRIGHTNESS_TOPIC).encode())
-                mqtt_client.subscribe((MQTT_BRIGHTNESS_STATE_TOPIC).encode())
-                mqtt_client.subscribe((MQTT_COLORTEMP_TOPIC).encode())
-                # Subscribe to topics for rgb and effect light control
-                mqtt_client.subscribe((MQTT_RGB_TOPIC).encode())
-                mqtt_client.subscribe((MQTT_RGB_STATE_TOPIC).encode())
-                mqtt_client.subscribe((MQTT_EFFECT_TOPIC).encode())
-                mqtt_client.subscribe((MQTT_EFFECT_STATE_TOPIC).encode())
-                # Publish Config for Auto Discovery
-                mqtt_client.publish((MQTT_CONFIG_TOPIC).encode(), device_json, retain=True)
-                print("MQTT Broker connected.")
-            ip_address = wifi.ifconfig()[0]
-            display.text(ip_address, 16, 56, 1)
+            if not mqtt_connected and (last_mqtt_attempt is None or time.ticks_diff(time.ticks_ms(), last_mqtt_attempt) >= MQTT_RETRY_MS):
+                last_mqtt_attempt = time.ticks_ms()
+                try:
+                    await mqtt_connect()
+                    print("MQTT Broker connected.")
+                except OSError:
+                    pass # broker unreachable, retry after MQTT_RETRY_MS
+                except Exception as e:
+                    # refused CONNACK, timed out handshake, ... never let it end this task
+                    print("MQTT connection failed:", e)
+            if not headless:
+                ip_address = wifi.ifconfig()[0]
+                display.text(ip_address, 16, 56, 1)
 
         else:
             if last_state != current_state:
                 print("Waiting for WiFi Connection")
+            mqtt_connected = False
+            last_mqtt_attempt = None
             display.text('Disconnected', 16, 56, 1)
         last_state=current_state
         await asyncio.sleep_ms(500)
@@ -606,57 +1041,67 @@ async def save_config(file_path="config.json"):
     global devices_config  # Assume devices_config is a global variable
 
     while True:
+        # Sleep until mqtt_callback reports a change
+        await config_dirty.wait()
+
+        # Debounce, only write once the state has been stable for CONFIG_SAVE_DELAY ms
+        while True:
+            remaining = CONFIG_SAVE_DELAY - time.ticks_diff(time.ticks_ms(), config_changed_at)
+            if remaining <= 0:
+                break
+            await asyncio.sleep_ms(remaining)
+        config_dirty.clear()
+
+        # config.json is only rewritten when a static setting changes
         isChanged = False
 
-        if devices_config["brightness"] != neopixel_brightness:
-            devices_config["brightness"] = neopixel_brightness
-            isChanged = True
-        if devices_config["mode"] != neopixel_mode:
-            devices_config["mode"] = neopixel_mode
-            isChanged = True
-        if devices_config["rgb"] != neopixel_rgb:
-            devices_config["rgb"] = neopixel_rgb
-            isChanged = True
+        for seg in segments:
+            # Light state goes to the segment's journal, a single small record append
+            current_state = (seg.brightness, seg.mode, seg.rgb)
+            if current_state != seg.journaled:
+                try:
+                    seg.journal.append(*current_state)
+                    seg.journaled = current_state
+                except (OSError, ValueError):
+                    print("Unable to update the state journal. Check disk space.")
+
+            if seg.config["transition"] != seg.transition:
+                seg.config["transition"] = seg.transition
+                isChanged = True
+
+            if not seg.params_saved:
+                seg.params_saved = True
+                isChanged = True
 
         if isChanged:
             # Update devices_config to config["devices"]
             config["devices"] = devices_config
 
-            # Convert Python object to JSON-formatted string with manual indentation
-            json_string = ujson.dumps(config)
-            indented_json = ""
-            level = 0
-
-            for char in json_string:
-                if char in ('{', '['):
-                    level += 1
-                    indented_json += char + '\n' + ' ' * (level * 4)
-                elif char in ('}', ']'):
-                    level -= 1
-                    indented_json = indented_json.rstrip() + '\n' + ' ' * (level * 4) + char
-                elif char == ',':
-                    indented_json += char + '\n' + ' ' * (level * 4)
-                else:
-                    indented_json += char
-
-            # Save the updated config string to config.json
+            # Write to a temporary file first, then swap it in so a power loss never leaves a truncated config.json
+            temp_path = file_path + ".tmp"
             try:
-                with open(file_path, "w") as config_file:
-                    config_file.write(indented_json)
+                with open(temp_path, "w") as config_file:
+                    ujson.dump(config, config_file)
+                try:
+                    os.rename(temp_path, file_path)
+                except OSError:
+                    # Some filesystems (FAT) refuse to rename over an existing file
+                    os.remove(file_path)
+                    os.rename(temp_path, file_path)
             except OSError:
                 print("Unable to update config.json. Check file permissions or disk space.")
 
-        # Wait for 500 milliseconds before the next iteration
-        await asyncio.sleep_ms(500)
-
 # Start the WiFi checking task in the background
+# The neopixel task is scheduled first so the LEDs light up before the display, HTTP and MQTT are set up
 loop = asyncio.get_event_loop()
 loop.create_task(run_neopixel())
+loop.create_task(init_display())
+loop.create_task(wifi_manager.run())
 loop.create_task(check_wifi())
 loop.create_task(mqtt_message_checker())
 loop.create_task(mqtt_message_sender())
 loop.create_task(save_config())
-loop.create_task(main())
+loop.create_task(charger_monitor())
 
 # Run the event loop indefinitely
 loop.run_forever()
\ No newline at end of file
@@ -0,0 +1,179 @@
+# Host-side checks and benchmarks for lib/async_urequests.py
+#
+# Runs the client under CPython's asyncio through tools/upy_shim.py against the local
+# stand-in server in tools/http_server.py, no board or network needed.
+#
+#   python tools/bench_urequests.py            # checks, then benchmarks
+#   python tools/bench_urequests.py --quick    # checks only
+#
+# Exits non-zero when a check fails. Numbers are host numbers, use them to compare
+# changes to the client, not to predict on-device throughput.
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+
+import upy_shim
+
+upy_shim.install()
+
+import async_urequests as requests  # noqa: E402
+from http_server import TestServer  # noqa: E402
+
+failures = []
+
+
+def check(name, condition, detail=""):
+    print("%-4s %s %s" % ("ok" if condition else "FAIL", name, detail))
+    if not condition:
+        failures.append(name)
+
+
+async def run_checks(server):
+    expected = bytes(i & 0xFF for i in range(5000))
+
+    r = await requests.get(server.url("/plain?size=5000"))
+    check("plain body", r.status_code == 200 and r.content == expected)
+    r = await requests.get(server.url("/chunked?size=5000&chunk=300"))
+    check("chunked body", r.content == expected)
+    r = await requests.get(server.url("/close?size=5000"))
+    check("body ends on close", r.content == expected)
+    r = await requests.get(server.url("/redirect?to=/plain%3Fsize=10"))
+    check("redirect", r.status_code == 200 and r.content == expected[:10], r.url)
+    r = await requests.head(server.url("/plain?size=5000"))
+    check("head", r.status_code == 200 and r.content == b"")
+
+    r = await requests.get(server.url("/json"))
+    check("json", r.json()["dst"] is False)
+    check("header lookup", r.header("CONTENT-TYPE") == "application/json; charset=utf-8" and "Content-Length" in r.headers)
+    r = await requests.get(server.url("/json"), stream=True)
+    fields = await r.json_fields("datetime", "day_of_week")
+    check("json_fields", fields == {"datetime": "2024-01-01T10:00:00.000000+01:00", "day_of_week": 1}, str(fields))
+
+    try:
+        await requests.get(server.url("/headers?count=50"))
+        check("max_headers", False)
+    except requests.ConnectionError:
+        check("max_headers", True)
+    try:
+        await requests.get(server.url("/headers?count=1&long=100000"))
+        check("long header line", False)
+    except requests.ConnectionError:
+        check("long header line", True)
+    # header lines dripped in, so both requests parse at the same time
+    a, b = await asyncio.gather(requests.get(server.url("/headers?count=5&delay=10&tag=a")),
+                                requests.get(server.url("/headers?count=5&delay=10&tag=bb")))
+    check("concurrent headers", a.header("X-Header-0") == "value-0a" and b.header("X-Header-0") == "value-0bb",
+          "%s %s" % (a.header("X-Header-0"), b.header("X-Header-0")))
+
+    r = await requests.get(server.url("/chunked?size=5000&chunk=700"), stream=True)
+    got = bytearray()
+    async for chunk in r.iter_content(256):
+        got += chunk
+    r.close()
+    check("iter_content", bytes(got) == expected)
+
+    session = requests.Session()
+    before = server.connections
+    for path in ("/plain?size=100", "/chunked?size=100", "/json", "/plain?size=0"):
+        await session.get(server.url(path))
+    check("keep-alive reuse", server.connections - before == 1, "%d connections" % (server.connections - before))
+    # drop the pooled socket under the session, the next request must reconnect transparently
+    for conns in session._pool.values():
+        for reader, last_used in conns:
+            reader.s.shutdown(2)
+    r = await session.get(server.url("/plain?size=100"))
+    check("stale pooled connection", r.content == expected[:100])
+    session.close()
+
+    start = time.monotonic()
+    try:
+        await requests.get(server.url("/slow?size=64&delay=500"), read_timeout=0.1)
+        check("read timeout", False)
+    except requests.TimeoutError as e:
+        check("read timeout", time.monotonic() - start < 0.4, str(e))
+    try:
+        await requests.get(server.url("/slow?size=64&delay=200"), timeout=0.5)
+        check("total timeout", False)
+    except requests.TimeoutError:
+        check("total timeout", True)
+    # headers arrive at once, the body stalls: the total timeout still ends the streamed read
+    start = time.monotonic()
+    session = requests.Session()
+    try:
+        r = await session.get(server.url("/slow?size=64&delay=1500"), stream=True, timeout=2)
+        await r.json_fields("datetime")
+        check("streamed body timeout", False)
+    except requests.TimeoutError:
+        check("streamed body timeout", time.monotonic() - start < 2.5 and not session._pool,
+              "%.1f s" % (time.monotonic() - start))
+    session.close()
+
+
+async def bench(label, make_request, count):
+    latencies = []
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(count):
+        t = time.perf_counter()
+        await make_request()
+        latencies.append(time.perf_counter() - t)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    latencies.sort()
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+
+    print("%-28s %8.0f req/s  p50 %6.2f ms  p90 %6.2f ms  p99 %6.2f ms  peak %7d B" % (
+        label, count / elapsed, pct(0.5), pct(0.9), pct(0.99), peak))
+
+
+async def run_benchmarks(server, count):
+    session = requests.Session()
+    await bench("get, new connection", lambda: requests.get(server.url("/plain?size=1024")), count)
+    await bench("get, keep-alive session", lambda: session.get(server.url("/plain?size=1024")), count)
+    await bench("chunked, keep-alive", lambda: session.get(server.url("/chunked?size=4096")), count)
+
+    async def streamed():
+        r = await session.get(server.url("/plain?size=262144"), stream=True)
+        buf = bytearray(512)
+        while await r.readinto(buf):
+            pass
+        r.close()
+
+    await bench("256 KB body, read()", lambda: session.get(server.url("/plain?size=262144")), count // 10)
+    await bench("256 KB body, readinto(512)", streamed, count // 10)
+
+    async def fields():
+        r = await session.get(server.url("/json"), stream=True)
+        await r.json_fields("datetime")
+
+    await bench("json()", lambda: session.get(server.url("/json")), count)
+    await bench("json_fields('datetime')", fields, count)
+    session.close()
+
+
+async def main(args):
+    server = await TestServer().start()
+    try:
+        await run_checks(server)
+        if not args.quick and not failures:
+            print()
+            await run_benchmarks(server, args.count)
+    finally:
+        await server.stop()
+    if failures:
+        print("\n%d check(s) failed: %s" % (len(failures), ", ".join(failures)))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check and benchmark async_urequests on the host")
+    parser.add_argument("--quick", action="store_true", help="run the checks only")
+    parser.add_argument("--count", type=int, default=200, help="requests per benchmark")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,131 @@
+# Host-side build script for ESPPowerStand
+#
+# Cross-compiles the libraries in lib/ to .mpy with mpy-cross so the device does not
+# compile them at every boot, optionally writes a manifest for freezing them into a
+# custom firmware, and can measure import time and heap use on a connected board.
+#
+#   python tools/build.py                 # build/lib/*.mpy
+#   python tools/build.py --manifest      # also build/manifest.py for a frozen firmware
+#   python tools/build.py --measure       # compare .py vs .mpy imports on the board (mpremote)
+#
+# Requires mpy-cross (pip install mpy-cross) and, for --measure, mpremote (pip install mpremote).
+# main.py and boot.py are copied as source, MicroPython only runs them from .py files.
+# build/font.bin is rendered from lib/vector_font.py alongside, see tools/build_font.py.
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+
+import build_font
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIB_DIR = os.path.join(ROOT, "lib")
+BUILD_DIR = os.path.join(ROOT, "build")
+SOURCE_FILES = ("main.py", "boot.py")
+FONT_SIZES = (1, 2, 3, 4)
+
+# Runs on the board, imports one module from a fresh heap and reports time and RAM used
+MEASURE_SNIPPET = """
+import gc, time
+gc.collect()
+free = gc.mem_free()
+start = time.ticks_us()
+import {module}
+elapsed = time.ticks_diff(time.ticks_us(), start)
+gc.collect()
+print("MEASURE", "{module}", elapsed, free - gc.mem_free())
+"""
+
+
+def lib_modules():
+    return sorted(name[:-3] for name in os.listdir(LIB_DIR) if name.endswith(".py"))
+
+
+def build(mpy_cross, march=None):
+    out_dir = os.path.join(BUILD_DIR, "lib")
+    os.makedirs(out_dir, exist_ok=True)
+    for module in lib_modules():
+        source = os.path.join(LIB_DIR, module + ".py")
+        target = os.path.join(out_dir, module + ".mpy")
+        command = [mpy_cross, "-O2", "-o", target]
+        if march:
+            command.append("-march=" + march)
+        command.append(source)
+        subprocess.check_call(command)
+        print("{:<20} {:>7} -> {:>7} bytes".format(module, os.path.getsize(source), os.path.getsize(target)))
+    for name in SOURCE_FILES:
+        shutil.copy(os.path.join(ROOT, name), os.path.join(BUILD_DIR, name))
+    with open(os.path.join(BUILD_DIR, "font.bin"), "wb") as f:
+        f.write(build_font.build_font(FONT_SIZES))
+
+
+def write_manifest():
+    # Freeze with: make BOARD=... FROZEN_MANIFEST=/path/to/build/manifest.py
+    path = os.path.join(BUILD_DIR, "manifest.py")
+    with open(path, "w") as f:
+        f.write('include("$(PORT_DIR)/boards/manifest.py")\n')
+        for module in lib_modules():
+            f.write('module("{}.py", base_path="{}")\n'.format(module, LIB_DIR.replace(os.sep, "/")))
+    print("Wrote", path)
+
+
+def mpremote(*args):
+    return subprocess.run(["mpremote"] + list(args), check=True, capture_output=True, text=True).stdout
+
+
+def measure_imports():
+    results = {}
+    for module in lib_modules():
+        output = mpremote("soft-reset", "exec", MEASURE_SNIPPET.format(module=module))
+        for line in output.splitlines():
+            if line.startswith("MEASURE"):
+                _, name, elapsed, heap = line.split()
+                results[name] = (int(elapsed), int(heap))
+    return results
+
+
+def deploy(variant):
+    # Put only one variant of every module on the board, MicroPython prefers .py over .mpy
+    subprocess.run(["mpremote", "mkdir", ":lib"], capture_output=True)  # fails harmlessly if it exists
+    for module in lib_modules():
+        if variant == "py":
+            keep, drop = os.path.join(LIB_DIR, module + ".py"), module + ".mpy"
+        else:
+            keep, drop = os.path.join(BUILD_DIR, "lib", module + ".mpy"), module + ".py"
+        subprocess.run(["mpremote", "rm", ":lib/" + drop], capture_output=True)
+        mpremote("cp", keep, ":lib/" + os.path.basename(keep))
+
+
+def measure():
+    deploy("py")
+    before = measure_imports()
+    deploy("mpy")
+    after = measure_imports()
+    print("{:<20} {:>12} {:>12} {:>12} {:>12}".format("module", "py us", "mpy us", "py bytes", "mpy bytes"))
+    for module in lib_modules():
+        b = before.get(module, (0, 0))
+        a = after.get(module, (0, 0))
+        print("{:<20} {:>12} {:>12} {:>12} {:>12}".format(module, b[0], a[0], b[1], a[1]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build .mpy files for ESPPowerStand")
+    parser.add_argument("--mpy-cross", default="mpy-cross", help="mpy-cross executable")
+    parser.add_argument("--march", help="native architecture passed to mpy-cross, e.g. rv32imc")
+    parser.add_argument("--manifest", action="store_true", help="write build/manifest.py for frozen modules")
+    parser.add_argument("--measure", action="store_true", help="measure .py vs .mpy imports on the board")
+    args = parser.parse_args()
+
+    if shutil.which(args.mpy_cross) is None:
+        sys.exit("mpy-cross not found, install it with: pip install mpy-cross")
+    build(args.mpy_cross, args.march)
+    if args.manifest:
+        write_manifest()
+    if args.measure:
+        measure()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# Renders lib/vector_font.py into the bitmap font file read by lib/bitmap_font.py
+#
+# Every glyph is drawn with the same line algorithm as MicroPython's framebuf, so the
+# bitmaps match what the vector font draws on the panel pixel for pixel.
+#
+#   python tools/build_font.py                      # build/font.bin, sizes 1-4
+#   python tools/build_font.py --sizes 3 -o font.bin
+#
+# Copy the file to the root of the board next to main.py.
+
+import argparse
+import os
+import struct
+import sys
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "lib"))
+sys.modules.setdefault("framebuf", types.ModuleType("framebuf"))  # bitmap_font only needs it on the board
+
+import bitmap_font  # noqa: E402
+import vector_font  # noqa: E402
+
+
+class Canvas:
+    # records the pixels a glyph sets, enough of the FrameBuffer API for vector_font
+
+    def __init__(self):
+        self.pixels = set()
+
+    def line(self, x1, y1, x2, y2, col):
+        # port of framebuf.c line()
+        dx, sx = (x2 - x1, 1) if x2 > x1 else (x1 - x2, -1)
+        dy, sy = (y2 - y1, 1) if y2 > y1 else (y1 - y2, -1)
+        steep = dy > dx
+        if steep:
+            x1, y1, dx, dy, sx, sy = y1, x1, dy, dx, sy, sx
+        e = 2 * dy - dx
+        for _ in range(dx):
+            self.pixels.add((y1, x1) if steep else (x1, y1))
+            while e >= 0:
+                y1 += sy
+                e -= 2 * dx
+            x1 += sx
+            e += 2 * dy
+        self.pixels.add((x2, y2))
+
+
+def render(glyph, font_size):
+    canvas = Canvas()
+    glyph(0, 0, canvas, font_size, 1)
+    if any(x < 0 or y < 0 for x, y in canvas.pixels):
+        raise ValueError("glyph draws left of or above its origin")
+    return canvas.pixels
+
+
+def to_vlsb(pixels, width, height):
+    data = bytearray(width * ((height + 7) // 8))
+    for x, y in pixels:
+        data[(y >> 3) * width + x] |= 1 << (y & 7)
+    return bytes(data)
+
+
+def build_font(sizes):
+    # one glyph per character, lowercase aliases are resolved by the reader
+    glyphs = {}
+    for char, glyph in vector_font.GLYPHS.items():
+        glyphs.setdefault(char.upper(), glyph)
+    chars = sorted(glyphs)
+
+    rendered = {}
+    for font_size in sizes:
+        rendered[font_size] = [render(glyphs[c], font_size) for c in chars]
+
+    header = struct.pack(bitmap_font.HEADER_FORMAT, bitmap_font.MAGIC, bitmap_font.VERSION, len(chars), len(sizes))
+    header += bytes(ord(c) for c in chars)
+    table_offset = len(header) + len(sizes) * bitmap_font.SIZE_SIZE
+    bitmap_offset = table_offset + len(sizes) * len(chars) * bitmap_font.GLYPH_SIZE
+
+    size_table = b""
+    glyph_tables = b""
+    bitmaps = b""
+    for font_size in sizes:
+        height = max((y for pixels in rendered[font_size] for x, y in pixels), default=0) + 1
+        size_table += struct.pack(bitmap_font.SIZE_FORMAT, font_size, height, font_size * 5,
+                                  table_offset + len(glyph_tables))
+        for pixels in rendered[font_size]:
+            if not pixels:
+                glyph_tables += struct.pack(bitmap_font.GLYPH_FORMAT, 0, 0)
+                continue
+            width = max(x for x, y in pixels) + 1
+            glyph_tables += struct.pack(bitmap_font.GLYPH_FORMAT, bitmap_offset + len(bitmaps), width)
+            bitmaps += to_vlsb(pixels, width, height)
+    return header + size_table + glyph_tables + bitmaps
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render the vector font into font.bin")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 2, 3, 4], help="font sizes to include")
+    parser.add_argument("-o", "--output", default=os.path.join(ROOT, "build", "font.bin"), help="output file")
+    args = parser.parse_args()
+
+    data = build_font(sorted(set(args.sizes)))
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "wb") as f:
+        f.write(data)
+    print("Wrote", args.output, len(data), "bytes")
+
+
+if __name__ == "__main__":
+    main()
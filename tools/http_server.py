@@ -0,0 +1,143 @@
+# Local HTTP stand-in server for exercising async_urequests on the host
+#
+# Routes (query parameters are optional):
+#   /plain?size=N             Content-Length body of N bytes
+#   /chunked?size=N&chunk=M   chunked body of N bytes in M byte chunks
+#   /close?size=N             body without Content-Length, ends when the connection closes
+#   /redirect?to=/plain       302 to another route
+#   /slow?size=N&delay=MS     body dripped in 16 byte pieces, MS ms apart (first byte delayed too)
+#   /json                     worldtimeapi-like JSON object
+#   /headers?count=N          response with N extra headers
+#            &tag=T&long=L&delay=MS   header values end in T, plus one L byte header, lines MS ms apart
+# HTTP/1.1 connections stay open unless the client sends Connection: close.
+#
+#   python tools/http_server.py [port]
+
+import asyncio
+import json
+import sys
+from urllib.parse import unquote
+
+JSON_BODY = json.dumps({
+    "abbreviation": "CET",
+    "client_ip": "127.0.0.1",
+    "datetime": "2024-01-01T10:00:00.000000+01:00",
+    "day_of_week": 1,
+    "dst": False,
+    "timezone": "Europe/Berlin",
+    "utc_offset": "+01:00",
+    "nested": {"datetime": "not this one", "list": [1, 2, {"a": "}"}]},
+}).encode()
+
+
+class TestServer:
+    def __init__(self, host="127.0.0.1", port=0):
+        self.host = host
+        self.port = port
+        self.connections = 0  # accepted TCP connections, to check keep-alive reuse
+        self.requests = 0
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    def url(self, path):
+        return "http://%s:%d%s" % (self.host, self.port, path)
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                method, target, version = line.decode().split()
+                headers = {}
+                while True:
+                    h = await reader.readline()
+                    if h in (b"\r\n", b""):
+                        break
+                    name, value = h.decode().split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+                if "content-length" in headers:
+                    await reader.readexactly(int(headers["content-length"]))
+                self.requests += 1
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                keep_alive = await self._respond(writer, method, target, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, method, target, keep_alive):
+        path, _, query = target.partition("?")
+        args = dict(unquote(p).split("=", 1) for p in query.split("&") if "=" in p)
+        size = int(args.get("size", 1024))
+        conn = b"Connection: keep-alive\r\n" if keep_alive else b"Connection: close\r\n"
+
+        def head(status, extra=b""):
+            writer.write(b"HTTP/1.1 " + status + b"\r\n" + conn + extra + b"\r\n")
+
+        body = bytes(i & 0xFF for i in range(size))
+        if path == "/plain":
+            head(b"200 OK", b"Content-Length: %d\r\n" % size)
+            if method != "HEAD":
+                writer.write(body)
+        elif path == "/chunked":
+            chunk = int(args.get("chunk", 256))
+            head(b"200 OK", b"Transfer-Encoding: chunked\r\n")
+            for i in range(0, size, chunk):
+                part = body[i:i + chunk]
+                writer.write(b"%x\r\n" % len(part) + part + b"\r\n")
+            writer.write(b"0\r\n\r\n")
+        elif path == "/close":
+            writer.write(b"HTTP/1.1 200 OK\r\nConnection: close\r\n\r\n" + body)
+            return False
+        elif path == "/redirect":
+            head(b"302 Found", b"Location: %s\r\nContent-Length: 0\r\n" % self.url(args.get("to", "/plain")).encode())
+        elif path == "/slow":
+            delay = int(args.get("delay", 100)) / 1000
+            await asyncio.sleep(delay)
+            head(b"200 OK", b"Content-Length: %d\r\n" % size)
+            for i in range(0, size, 16):
+                writer.write(body[i:i + 16])
+                await writer.drain()
+                await asyncio.sleep(delay)
+        elif path == "/json":
+            head(b"200 OK", b"Content-Type: application/json; charset=utf-8\r\nContent-Length: %d\r\n" % len(JSON_BODY))
+            writer.write(JSON_BODY)
+        elif path == "/headers":
+            tag = args.get("tag", "").encode()
+            lines = [b"X-Header-%d: value-%d%s\r\n" % (i, i, tag) for i in range(int(args.get("count", 10)))]
+            if "long" in args:
+                lines.append(b"X-Long: " + b"x" * int(args["long"]) + b"\r\n")
+            delay = int(args.get("delay", 0)) / 1000
+            writer.write(b"HTTP/1.1 200 OK\r\n" + conn)
+            for line in lines:
+                if delay:
+                    await writer.drain()
+                    await asyncio.sleep(delay)
+                writer.write(line)
+            writer.write(b"Content-Length: 2\r\n\r\nok")
+        else:
+            head(b"404 Not Found", b"Content-Length: 0\r\n")
+        return keep_alive
+
+
+async def _serve(port):
+    server = await TestServer(port=port).start()
+    print("Serving on", server.url("/"))
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    asyncio.run(_serve(int(sys.argv[1]) if len(sys.argv) > 1 else 8080))
@@ -0,0 +1,152 @@
+# Minimal MicroPython compatibility shim for running lib/ modules under CPython
+#
+# Maps the u-prefixed modules and the parts of uasyncio that async_urequests relies on
+# (core._io_queue, stream.Stream, sleep_ms) onto CPython's asyncio, and adds the
+# MicroPython-only gc/time helpers. Host-side only, never copied to the board.
+
+import asyncio
+import errno
+import gc as _gc
+import json
+import os
+import socket
+import sys
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class _IOQueue:
+    # queue_read/queue_write return a future the awaiting task yields on
+
+    def _wait(self, s, add, remove):
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        fd = s.fileno()
+
+        def ready():
+            remove(fd)
+            if not fut.done():
+                fut.set_result(None)
+
+        add(fd, ready)
+        fut.add_done_callback(lambda f: remove(fd) if f.cancelled() else None)
+        return fut
+
+    def queue_read(self, s):
+        loop = asyncio.get_running_loop()
+        return self._wait(s, loop.add_reader, loop.remove_reader)
+
+    def queue_write(self, s):
+        loop = asyncio.get_running_loop()
+        return self._wait(s, loop.add_writer, loop.remove_writer)
+
+
+class Stream:
+    # subset of uasyncio.stream.Stream on top of a non-blocking socket
+
+    def __init__(self, s):
+        self.s = s
+        self._buf = b""
+
+    async def _recv(self, n):
+        return await asyncio.get_running_loop().sock_recv(self.s, n)
+
+    async def readline(self):
+        while b"\n" not in self._buf:
+            data = await self._recv(4096)
+            if not data:
+                line, self._buf = self._buf, b""
+                return line
+            self._buf += data
+        i = self._buf.index(b"\n") + 1
+        line, self._buf = self._buf[:i], self._buf[i:]
+        return line
+
+    async def read(self, n=-1):
+        if n < 0:
+            parts = [self._buf]
+            self._buf = b""
+            while True:
+                data = await self._recv(4096)
+                if not data:
+                    return b"".join(parts)
+                parts.append(data)
+        if self._buf:
+            data, self._buf = self._buf[:n], self._buf[n:]
+            return data
+        return await self._recv(n)
+
+    async def readexactly(self, n):
+        data = b""
+        while len(data) < n:
+            part = await self.read(n - len(data))
+            if not part:
+                raise EOFError
+            data += part
+        return data
+
+    async def readinto(self, buf):
+        if self._buf:
+            n = min(len(buf), len(self._buf))
+            buf[:n] = self._buf[:n]
+            self._buf = self._buf[n:]
+            return n
+        return await asyncio.get_running_loop().sock_recv_into(self.s, buf)
+
+    async def awrite(self, data):
+        await asyncio.get_running_loop().sock_sendall(self.s, data)
+
+    async def wait_closed(self):
+        self.s.close()
+
+
+def _sleep_ms(ms):
+    return asyncio.sleep(ms / 1000)
+
+
+def install():
+    # idempotent, call before importing any lib/ module
+    if "uasyncio" in sys.modules:
+        return
+
+    core = types.ModuleType("uasyncio.core")
+    core._io_queue = _IOQueue()
+    stream = types.ModuleType("uasyncio.stream")
+    stream.Stream = Stream
+
+    uasyncio = types.ModuleType("uasyncio")
+    uasyncio.__dict__.update({k: v for k, v in asyncio.__dict__.items() if not k.startswith("__")})
+    uasyncio.core = core
+    uasyncio.stream = stream
+    uasyncio.sleep_ms = _sleep_ms
+    uasyncio.__path__ = []
+
+    gc = types.ModuleType("gc")
+    gc.collect = _gc.collect
+    gc.mem_free = lambda: 1 << 20
+    gc.mem_alloc = lambda: 0
+    gc.threshold = lambda *args: -1
+
+    time.ticks_ms = lambda: int(time.monotonic() * 1000)
+    time.ticks_us = lambda: int(time.monotonic() * 1000000)
+    time.ticks_diff = lambda a, b: a - b
+    time.ticks_add = lambda a, b: a + b
+
+    sys.modules.update({
+        "uasyncio": uasyncio,
+        "uasyncio.core": core,
+        "uasyncio.stream": stream,
+        "usocket": socket,
+        "uerrno": errno,
+        "ujson": json,
+    })
+    # async_urequests binds the MicroPython-flavoured gc at import time
+    real_gc = sys.modules["gc"]
+    sys.modules["gc"] = gc
+    try:
+        sys.path.insert(0, os.path.join(ROOT, "lib"))
+        import async_urequests  # noqa: F401
+    finally:
+        sys.modules["gc"] = real_gc